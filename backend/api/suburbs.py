@@ -2,199 +2,128 @@
 Suburbs API Blueprint
 Handles all suburb-related endpoints
 """
-from flask import Blueprint, jsonify, request
-from middleware import handle_errors, ApiError, validate_suburb_id, validate_search_query
+from flask import Blueprint, request
+from middleware import (
+    compose_view,
+    ApiError,
+    validate_suburb_id,
+    search_query_validator,
+    raw_json_response,
+    parse_bool_param,
+)
 
 suburbs_bp = Blueprint('suburbs', __name__)
 
-
-def get_suburb_data(suburb_id: str, service_method, error_message: str):
-    """Common pattern for fetching suburb-related data"""
+# Query parameter parsers, keyed by parameter name
+QUERY_PARAM_PARSERS = {
+    'geojson': lambda args: parse_bool_param(args, 'geojson'),
+    'metric': lambda args: args.get('metric'),
+    'property_type': lambda args: args.get('property_type'),
+}
+
+# Suburb endpoints: (url, endpoint name, service method, query params, not-found message)
+SUBURB_ROUTES = [
+    ('/suburb/<suburb_id>', 'get_suburb', 'get_suburb_details',
+     (), "Suburb not found"),
+    ('/suburb/<suburb_id>/demographics', 'get_demographics', 'get_demographics',
+     (), "Demographics not found"),
+    ('/suburb/<suburb_id>/amenities', 'get_amenities', 'get_amenities',
+     (), "Amenities not found"),
+    ('/suburb/<suburb_id>/market-trends', 'get_market_trends', 'get_market_trends',
+     (), "Market trends not found"),
+    ('/suburb/<suburb_id>/schools', 'get_schools', 'get_schools',
+     (), "Schools not found"),
+    ('/suburb/<suburb_id>/developments', 'get_developments', 'get_developments',
+     (), "Developments not found"),
+    ('/suburb/<suburb_id>/market-insights', 'get_market_insights', 'get_market_insights',
+     ('metric', 'property_type'), "Market insights not found"),
+    ('/suburb/<suburb_id>/pocket-insights', 'get_pocket_insights', 'get_pocket_insights',
+     ('geojson', 'property_type'), "Pocket insights not found"),
+    ('/suburb/<suburb_id>/street-insights', 'get_street_insights', 'get_street_insights',
+     ('geojson', 'property_type'), "Street insights not found"),
+    ('/suburb/<suburb_id>/risk', 'get_risk_factors', 'get_risk_factors',
+     ('geojson',), "Risk factors not found"),
+    ('/suburb/<suburb_id>/info', 'get_suburb_info', 'get_suburb_info',
+     ('geojson',), "Suburb info not found"),
+    ('/suburb/<suburb_id>/summary', 'get_suburb_summary', 'get_suburb_summary',
+     (), "Suburb summary not found"),
+    ('/suburb/<suburb_id>/catchments', 'get_school_catchments', 'get_school_catchments',
+     ('geojson',), "School catchments not found"),
+    ('/suburb/<suburb_id>/zoning', 'get_zoning', 'get_zoning',
+     ('geojson',), "Zoning info not found"),
+    ('/suburb/<suburb_id>/similar', 'get_similar_suburbs', 'get_similar_suburbs',
+     ('geojson',), "Similar suburbs not found"),
+    ('/suburbs/<suburb_id>/street-rankings', 'get_street_rankings', 'get_street_rankings',
+     ('property_type',), "Street rankings not found"),
+]
+
+
+def get_suburb_data(data_service, method_name: str, error_message: str, suburb_id: str, *args):
+    """Common pattern for fetching suburb-related data as pre-serialized JSON"""
     validate_suburb_id(suburb_id)
-    data = service_method(suburb_id)
+    body = data_service.get_json(method_name, suburb_id, *args)
 
-    if not data:
+    if body is None:
         raise ApiError(error_message, status_code=404)
 
-    return jsonify(data), 200
+    return raw_json_response(body), 200
+
+
+def make_suburb_view(data_service, method_name: str, error_message: str, params: tuple):
+    """
+    Build a view function for a suburb endpoint
+
+    Args:
+        data_service: DataAggregatorService instance
+        method_name: Name of the service getter to call
+        error_message: Message for the 404 raised when no data is found
+        params: Names of the query parameters forwarded to the getter, in order
+
+    Returns:
+        View function taking suburb_id
+    """
+    parsers = tuple(QUERY_PARAM_PARSERS[name] for name in params)
+
+    def view(suburb_id):
+        args = request.args
+        return get_suburb_data(
+            data_service,
+            method_name,
+            error_message,
+            suburb_id,
+            *(parse(args) for parse in parsers)
+        )
+
+    return view
 
 
 def init_routes(data_service):
     """Initialize routes with data service dependency"""
 
-    @suburbs_bp.route('/suburbs/search', methods=['GET'])
-    @handle_errors('search_suburbs')
-    @validate_search_query(min_length=1, max_length=100)
     def search_suburbs():
         """Search suburbs by name"""
         query = request.args.get('q', '')
-        results = data_service.search_suburbs(query)
-        return jsonify(results), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>', methods=['GET'])
-    @handle_errors('get_suburb')
-    def get_suburb(suburb_id):
-        """Get suburb details by ID"""
-        validate_suburb_id(suburb_id)
-        suburb = data_service.get_suburb_details(suburb_id)
-
-        if not suburb:
-            raise ApiError("Suburb not found", status_code=404)
-
-        return jsonify(suburb), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/demographics', methods=['GET'])
-    @handle_errors('get_demographics')
-    def get_demographics(suburb_id):
-        """Get demographics data for a suburb"""
-        return get_suburb_data(suburb_id, data_service.get_demographics, "Demographics not found")
-
-    @suburbs_bp.route('/suburb/<suburb_id>/amenities', methods=['GET'])
-    @handle_errors('get_amenities')
-    def get_amenities(suburb_id):
-        """Get amenities data for a suburb"""
-        return get_suburb_data(suburb_id, data_service.get_amenities, "Amenities not found")
-
-    @suburbs_bp.route('/suburb/<suburb_id>/market-trends', methods=['GET'])
-    @handle_errors('get_market_trends')
-    def get_market_trends(suburb_id):
-        """Get market trends data for a suburb"""
-        return get_suburb_data(suburb_id, data_service.get_market_trends, "Market trends not found")
-
-    @suburbs_bp.route('/suburb/<suburb_id>/schools', methods=['GET'])
-    @handle_errors('get_schools')
-    def get_schools(suburb_id):
-        """Get schools data for a suburb"""
-        return get_suburb_data(suburb_id, data_service.get_schools, "Schools not found")
-
-    @suburbs_bp.route('/suburb/<suburb_id>/developments', methods=['GET'])
-    @handle_errors('get_developments')
-    def get_developments(suburb_id):
-        """Get development applications for a suburb"""
-        return get_suburb_data(suburb_id, data_service.get_developments, "Developments not found")
-
-    @suburbs_bp.route('/suburb/<suburb_id>/market-insights', methods=['GET'])
-    @handle_errors('get_market_insights')
-    def get_market_insights(suburb_id):
-        """Get market insights for a suburb"""
-        validate_suburb_id(suburb_id)
-        metric = request.args.get('metric')
-        property_type = request.args.get('property_type')
-        data = data_service.get_market_insights(suburb_id, metric, property_type)
-
-        if not data:
-            raise ApiError("Market insights not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/pocket-insights', methods=['GET'])
-    @handle_errors('get_pocket_insights')
-    def get_pocket_insights(suburb_id):
-        """Get pocket-level market insights for a suburb"""
-        validate_suburb_id(suburb_id)
-        geojson = request.args.get('geojson', 'true').lower() == 'true'
-        property_type = request.args.get('property_type')
-        data = data_service.get_pocket_insights(suburb_id, geojson, property_type)
-
-        if not data:
-            raise ApiError("Pocket insights not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/street-insights', methods=['GET'])
-    @handle_errors('get_street_insights')
-    def get_street_insights(suburb_id):
-        """Get street-level market insights for a suburb"""
-        validate_suburb_id(suburb_id)
-        geojson = request.args.get('geojson', 'true').lower() == 'true'
-        property_type = request.args.get('property_type')
-        data = data_service.get_street_insights(suburb_id, geojson, property_type)
-
-        if not data:
-            raise ApiError("Street insights not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/risk', methods=['GET'])
-    @handle_errors('get_risk_factors')
-    def get_risk_factors(suburb_id):
-        """Get risk factors for a suburb"""
-        validate_suburb_id(suburb_id)
-        geojson = request.args.get('geojson', 'true').lower() == 'true'
-        data = data_service.get_risk_factors(suburb_id, geojson)
-
-        if not data:
-            raise ApiError("Risk factors not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/info', methods=['GET'])
-    @handle_errors('get_suburb_info')
-    def get_suburb_info(suburb_id):
-        """Get suburb basic geographical information"""
-        validate_suburb_id(suburb_id)
-        geojson = request.args.get('geojson', 'true').lower() == 'true'
-        data = data_service.get_suburb_info(suburb_id, geojson)
-
-        if not data:
-            raise ApiError("Suburb info not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/summary', methods=['GET'])
-    @handle_errors('get_suburb_summary')
-    def get_suburb_summary(suburb_id):
-        """Get AI-generated suburb summary and scores"""
-        return get_suburb_data(suburb_id, data_service.get_suburb_summary, "Suburb summary not found")
-
-    @suburbs_bp.route('/suburb/<suburb_id>/catchments', methods=['GET'])
-    @handle_errors('get_school_catchments')
-    def get_school_catchments(suburb_id):
-        """Get school catchment areas for a suburb"""
-        validate_suburb_id(suburb_id)
-        geojson = request.args.get('geojson', 'true').lower() == 'true'
-        data = data_service.get_school_catchments(suburb_id, geojson)
-
-        if not data:
-            raise ApiError("School catchments not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/zoning', methods=['GET'])
-    @handle_errors('get_zoning')
-    def get_zoning(suburb_id):
-        """Get zoning information for a suburb"""
-        validate_suburb_id(suburb_id)
-        geojson = request.args.get('geojson', 'true').lower() == 'true'
-        data = data_service.get_zoning(suburb_id, geojson)
-
-        if not data:
-            raise ApiError("Zoning info not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburb/<suburb_id>/similar', methods=['GET'])
-    @handle_errors('get_similar_suburbs')
-    def get_similar_suburbs(suburb_id):
-        """Get similar suburbs"""
-        validate_suburb_id(suburb_id)
-        geojson = request.args.get('geojson', 'true').lower() == 'true'
-        data = data_service.get_similar_suburbs(suburb_id, geojson)
-
-        if not data:
-            raise ApiError("Similar suburbs not found", status_code=404)
-
-        return jsonify(data), 200
-
-    @suburbs_bp.route('/suburbs/<suburb_id>/street-rankings', methods=['GET'])
-    @handle_errors('get_street_rankings')
-    def get_street_rankings(suburb_id):
-        """Get street rankings for a suburb"""
-        validate_suburb_id(suburb_id)
-        property_type = request.args.get('property_type')
-        data = data_service.get_street_rankings(suburb_id, property_type)
-
-        if not data:
-            raise ApiError("Street rankings not found", status_code=404)
-
-        return jsonify(data), 200
+        body = data_service.get_json('search_suburbs', query)
+        return raw_json_response(body or b'[]'), 200
+
+    suburbs_bp.add_url_rule(
+        '/suburbs/search',
+        endpoint='search_suburbs',
+        view_func=compose_view(
+            search_suburbs,
+            'search_suburbs',
+            validators=(search_query_validator(min_length=1, max_length=100),)
+        ),
+        methods=['GET'],
+        provide_automatic_options=False
+    )
+
+    for url, endpoint, method_name, params, error_message in SUBURB_ROUTES:
+        view = make_suburb_view(data_service, method_name, error_message, params)
+        suburbs_bp.add_url_rule(
+            url,
+            endpoint=endpoint,
+            view_func=compose_view(view, endpoint),
+            methods=['GET'],
+            provide_automatic_options=False
+        )
@@ -1,24 +1,40 @@
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
+from flask_compress import Compress
 import os
 import logging
-from dotenv import load_dotenv
 from services.data_aggregator import DataAggregatorService
 from config import config
 from middleware import register_error_handlers, register_request_tracker
 from api.suburbs import suburbs_bp, init_routes
-
-load_dotenv()
+from utils import OrjsonProvider, start_queue_logging
 
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, config.LOG_LEVEL),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+# Write log records from a background thread so requests only enqueue them
+start_queue_logging()
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__, static_folder='static', static_url_path='')
 
+# Serialize JSON responses with orjson, without key sorting or pretty-printing
+app.json = OrjsonProvider(app)
+app.json.sort_keys = False
+app.json.compact = True
+
+# Compress JSON and frontend assets (brotli preferred, gzip fallback)
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css', 'application/javascript'],
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_MIN_SIZE=1024,
+)
+Compress(app)
+
 # Configure CORS
 CORS(app, resources={
     r"/api/*": {
@@ -39,18 +55,38 @@ register_request_tracker(app)
 init_routes(data_service)
 app.register_blueprint(suburbs_bp, url_prefix='/api')
 
+# API routes are registered without automatic OPTIONS handling; answer every
+# preflight with one empty response and let flask-cors add the CORS headers
+PREFLIGHT_HEADERS = (('Allow', 'GET, HEAD, OPTIONS'),)
+
+
+@app.before_request
+def handle_preflight():
+    """Short-circuit CORS preflight requests for API routes"""
+    if request.method == 'OPTIONS' and request.path.startswith('/api/'):
+        return app.response_class(status=204, headers=PREFLIGHT_HEADERS)
+
+
+# Built frontend files are fixed at startup, so index them once instead of
+# probing the filesystem on every SPA request
+STATIC_FILES = frozenset(
+    os.path.relpath(os.path.join(root, name), app.static_folder).replace(os.sep, '/')
+    for root, _, names in os.walk(app.static_folder)
+    for name in names
+)
+HAS_INDEX_HTML = 'index.html' in STATIC_FILES
+
 
 # SPA route handler - serve frontend
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve(path):
     """Serve static files or index.html for SPA routing"""
-    if path and os.path.exists(os.path.join(app.static_folder, path)):
+    if path in STATIC_FILES:
         return send_from_directory(app.static_folder, path)
     else:
         # Check if static folder has index.html
-        index_path = os.path.join(app.static_folder, 'index.html')
-        if os.path.exists(index_path):
+        if HAS_INDEX_HTML:
             return send_from_directory(app.static_folder, 'index.html')
         else:
             return jsonify({
@@ -3,48 +3,81 @@ Configuration Module
 Manages application settings and environment variables
 """
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict
 from dotenv import load_dotenv
 
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration class"""
-    
+    """Application configuration, read from the environment once at import"""
+
     # Microburbs API Configuration
-    MICROBURBS_API_BASE_URL = os.getenv(
+    MICROBURBS_API_BASE_URL: str = os.getenv(
         'MICROBURBS_API_BASE_URL',
         'https://www.microburbs.com.au/report_generator/api'
     )
-    MICROBURBS_API_TOKEN = os.getenv('MICROBURBS_API_TOKEN', 'test')
-    
+    MICROBURBS_API_TOKEN: str = field(default=os.getenv('MICROBURBS_API_TOKEN', 'test'), repr=False)
+
+    # API request headers, built once from the token (treat as read-only)
+    API_HEADERS: Dict[str, str] = field(init=False, repr=False, compare=False)
+
     # API request timeout (seconds)
-    API_TIMEOUT = int(os.getenv('API_TIMEOUT', '10'))
-    
+    API_TIMEOUT: int = int(os.getenv('API_TIMEOUT', '10'))
+
+    # Wait this long (seconds) for the API before answering from fallback files
+    API_SOFT_TIMEOUT: float = float(os.getenv('API_SOFT_TIMEOUT', '3'))
+
+    # Consecutive API failures that stop API calls, and for how long (seconds)
+    API_BREAKER_THRESHOLD: int = int(os.getenv('API_BREAKER_THRESHOLD', '5'))
+    API_BREAKER_COOLDOWN: float = float(os.getenv('API_BREAKER_COOLDOWN', '30'))
+
+    # Fetch the other sections of a suburb page in the background once its info is requested
+    API_PREFETCH: bool = os.getenv('API_PREFETCH', 'True').lower() == 'true'
+
+    # Keep-alive connections held per upstream host
+    API_POOL_SIZE: int = int(os.getenv('API_POOL_SIZE', '32'))
+
+    # Response cache settings (seconds / number of entries)
+    CACHE_TTL: int = int(os.getenv('CACHE_TTL', '300'))
+    CACHE_MAX_ENTRIES: int = int(os.getenv('CACHE_MAX_ENTRIES', '512'))
+    # How long the last good API answer may be served when the API fails (seconds)
+    CACHE_STALE_TTL: int = int(os.getenv('CACHE_STALE_TTL', '3600'))
+
     # Force use of static mock data (for debugging)
-    USE_MOCK_DATA = os.getenv('USE_MOCK_DATA', 'False').lower() == 'true'
-    
+    USE_MOCK_DATA: bool = os.getenv('USE_MOCK_DATA', 'False').lower() == 'true'
+
     # Data directory path
-    DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
-    
+    DATA_DIR: str = os.path.join(os.path.dirname(__file__), 'data')
+
     # Logging level
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+
     # Flask configuration
-    FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'True') == 'True'
-    FLASK_PORT = int(os.getenv('PORT', '5001'))
-    
-    @classmethod
-    def get_data_path(cls, filename):
-        """Get full path to data file"""
-        return os.path.join(cls.DATA_DIR, filename)
-    
-    @classmethod
-    def get_api_headers(cls):
-        """Get API request headers"""
-        return {
-            'Authorization': f'Bearer {cls.MICROBURBS_API_TOKEN}',
+    FLASK_DEBUG: bool = os.getenv('FLASK_DEBUG', 'True') == 'True'
+    FLASK_PORT: int = int(os.getenv('PORT', '5001'))
+
+    def __post_init__(self):
+        object.__setattr__(self, 'API_HEADERS', {
+            'Authorization': f'Bearer {self.MICROBURBS_API_TOKEN}',
             'Content-Type': 'application/json'
-        }
+        })
+
+    def get_data_path(self, filename):
+        """Get full path to data file"""
+        return _data_path(self.DATA_DIR, filename)
+
+    def get_api_headers(self):
+        """Get API request headers (shared dict, do not mutate)"""
+        return self.API_HEADERS
+
+
+@lru_cache(maxsize=None)
+def _data_path(data_dir: str, filename: str) -> str:
+    """Join data directory and filename (filenames come from a small fixed set)"""
+    return os.path.join(data_dir, filename)
 
 # Global configuration instance
 config = Config()
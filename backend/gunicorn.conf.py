@@ -0,0 +1,17 @@
+"""
+Gunicorn Configuration
+Production server settings; loaded automatically when gunicorn runs from this directory
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+
+# Threaded workers let blocking Microburbs API calls overlap within a process
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Must exceed API_TIMEOUT plus file fallback time
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+
+accesslog = '-'
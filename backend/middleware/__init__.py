@@ -2,19 +2,29 @@
 Middleware Package
 Provides reusable middleware for error handling, validation, and response formatting
 """
-from .error_handler import handle_errors, ApiError, register_error_handlers
-from .validators import validate_suburb_id, validate_query_params, validate_search_query
-from .response_formatter import success_response, error_response
+from .error_handler import handle_errors, compose_view, ApiError, register_error_handlers
+from .validators import (
+    validate_suburb_id,
+    validate_query_params,
+    validate_search_query,
+    search_query_validator,
+    parse_bool_param,
+)
+from .response_formatter import success_response, error_response, raw_json_response
 from .request_tracker import register_request_tracker
 
 __all__ = [
     'handle_errors',
+    'compose_view',
     'ApiError',
     'register_error_handlers',
     'validate_suburb_id',
     'validate_query_params',
     'validate_search_query',
+    'search_query_validator',
+    'parse_bool_param',
     'success_response',
     'error_response',
+    'raw_json_response',
     'register_request_tracker',
 ]
@@ -5,7 +5,7 @@ Provides unified error handling for API routes
 import logging
 from functools import wraps
 from flask import jsonify
-from typing import Callable, Tuple, Any
+from typing import Callable, Sequence, Tuple, Any
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +38,69 @@ class ApiError(Exception):
         return error_dict
 
 
+def compose_view(
+    view: Callable,
+    endpoint_name: str = None,
+    validators: Sequence[Callable[[], None]] = ()
+) -> Callable:
+    """
+    Wrap a route handler with validation and unified error handling in a single frame
+
+    The handler must return a complete ``(response, status)`` tuple; it is
+    passed through to Flask unchanged.
+
+    Args:
+        view: Route handler
+        endpoint_name: Name of the endpoint for logging (defaults to the handler name)
+        validators: Callables run before the handler; they raise ApiError or ValueError
+
+    Returns:
+        Wrapped route handler
+
+    Usage:
+        view = compose_view(search, 'search_suburbs', validators=(check_query,))
+        bp.add_url_rule('/search', endpoint='search_suburbs', view_func=view)
+    """
+    name = endpoint_name or view.__name__
+    validators = tuple(validators)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs) -> Tuple[Any, int]:
+        try:
+            for validate in validators:
+                validate()
+
+            return view(*args, **kwargs)
+
+        except ApiError as e:
+            # Custom API errors
+            logger.warning(f"API Error in {name}: {e.message}", extra={
+                'status_code': e.status_code,
+                'details': e.details
+            })
+            return jsonify(e.to_dict()), e.status_code
+
+        except ValueError as e:
+            # Validation errors
+            logger.warning(f"Validation error in {name}: {str(e)}")
+            return jsonify({
+                'error': 'Invalid request parameters',
+                'message': str(e),
+                'status_code': 400
+            }), 400
+
+        except Exception as e:
+            # Unexpected errors
+            logger.error(f"Unexpected error in {name}: {str(e)}", exc_info=True)
+            return jsonify({
+                'error': 'Internal server error',
+                'message': 'An unexpected error occurred',
+                'status_code': 500
+            }), 500
+
+    return wrapper
+
+
 def handle_errors(endpoint_name: str = None) -> Callable:
     """
     Decorator for unified error handling in route handlers
@@ -53,50 +116,10 @@ def handle_errors(endpoint_name: str = None) -> Callable:
         @handle_errors('example_endpoint')
         def example_route():
             # Your route logic
-            return data
+            return jsonify(data), 200
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> Tuple[Any, int]:
-            name = endpoint_name or func.__name__
-
-            try:
-                result = func(*args, **kwargs)
-
-                # If function returns tuple with status code
-                if isinstance(result, tuple):
-                    return result
-
-                # Default success response
-                return result, 200
-
-            except ApiError as e:
-                # Custom API errors
-                logger.warning(f"API Error in {name}: {e.message}", extra={
-                    'status_code': e.status_code,
-                    'details': e.details
-                })
-                return jsonify(e.to_dict()), e.status_code
-
-            except ValueError as e:
-                # Validation errors
-                logger.warning(f"Validation error in {name}: {str(e)}")
-                return jsonify({
-                    'error': 'Invalid request parameters',
-                    'message': str(e),
-                    'status_code': 400
-                }), 400
-
-            except Exception as e:
-                # Unexpected errors
-                logger.error(f"Unexpected error in {name}: {str(e)}", exc_info=True)
-                return jsonify({
-                    'error': 'Internal server error',
-                    'message': 'An unexpected error occurred',
-                    'status_code': 500
-                }), 500
-
-        return wrapper
+        return compose_view(func, endpoint_name)
     return decorator
 
 
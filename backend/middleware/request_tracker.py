@@ -2,10 +2,10 @@
 Request Tracker Middleware
 Adds request ID tracking and performance monitoring
 """
-import uuid
+import os
+import time
 import logging
 from flask import g, request, Flask
-from utils.performance import PerformanceMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -13,24 +13,25 @@ logger = logging.getLogger(__name__)
 def track_request():
     """Generate and attach request ID to current request"""
     # Generate unique request ID
-    request_id = request.headers.get('X-Request-ID') or str(uuid.uuid4())
+    request_id = request.headers.get('X-Request-ID') or os.urandom(16).hex()
     g.request_id = request_id
 
-    # Start performance timer
-    PerformanceMonitor.start_timer()
+    # Start performance timer (integer nanoseconds)
+    g.start_ns = time.monotonic_ns()
 
-    logger.info(
-        f"Request started - "
-        f"method: {request.method}, "
-        f"path: {request.path}, "
-        f"request_id: {request_id}, "
-        f"remote_addr: {request.remote_addr}"
+    # Access logs come from the WSGI server; keep this at DEBUG with lazy formatting
+    logger.debug(
+        "Request started - method: %s, path: %s, request_id: %s, remote_addr: %s",
+        request.method,
+        request.path,
+        request_id,
+        request.remote_addr
     )
 
 
-def add_response_headers(response):
+def finish_request(response):
     """
-    Add custom headers to response
+    Stop the request timer and add tracking headers to the response
 
     Args:
         response: Flask response object
@@ -38,13 +39,22 @@ def add_response_headers(response):
     Returns:
         Modified response with custom headers
     """
-    # Add request ID to response headers
-    if hasattr(g, 'request_id'):
-        response.headers['X-Request-ID'] = g.request_id
+    start_ns = g.get('start_ns')
+    if start_ns is None:
+        return response
+
+    duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+    request_id = g.request_id
+
+    logger.info(
+        "Request completed - endpoint: %s, duration: %.2fms, request_id: %s",
+        request.endpoint or 'unknown',
+        duration_ms,
+        request_id
+    )
 
-    # Add request duration to response headers
-    if hasattr(g, 'request_duration_ms'):
-        response.headers['X-Response-Time'] = f"{g.request_duration_ms}ms"
+    response.headers['X-Request-ID'] = request_id
+    response.headers['X-Response-Time'] = f"{duration_ms:.2f}ms"
 
     return response
 
@@ -53,6 +63,9 @@ def register_request_tracker(app: Flask):
     """
     Register request tracking middleware with Flask app
 
+    Unhandled exceptions are logged by the 500 error handler, so no
+    teardown hook is registered.
+
     Args:
         app: Flask application instance
 
@@ -60,28 +73,5 @@ def register_request_tracker(app: Flask):
         from middleware.request_tracker import register_request_tracker
         register_request_tracker(app)
     """
-    @app.before_request
-    def before_request():
-        """Execute before each request"""
-        track_request()
-
-    @app.after_request
-    def after_request(response):
-        """Execute after each request"""
-        # End performance timer
-        if hasattr(g, 'start_time'):
-            endpoint_name = request.endpoint or 'unknown'
-            PerformanceMonitor.end_timer(endpoint_name)
-
-        # Add response headers
-        return add_response_headers(response)
-
-    @app.teardown_request
-    def teardown_request(exception=None):
-        """Execute during request teardown"""
-        if exception:
-            logger.error(
-                f"Request failed - "
-                f"exception: {str(exception)}, "
-                f"request_id: {getattr(g, 'request_id', 'N/A')}"
-            )
+    app.before_request(track_request)
+    app.after_request(finish_request)
@@ -2,7 +2,7 @@
 Response Formatter
 Provides utilities for standardizing API responses
 """
-from flask import jsonify
+from flask import Response, jsonify
 from typing import Any, Dict, Tuple
 
 
@@ -108,3 +108,20 @@ def paginated_response(
         meta['has_prev'] = page > 1
 
     return success_response(items, meta=meta)
+
+
+def raw_json_response(body: bytes) -> Response:
+    """
+    Create response from already-serialized JSON bytes
+
+    Args:
+        body: UTF-8 encoded JSON document
+
+    Returns:
+        Flask response sending the bytes unmodified
+
+    Usage:
+        body = data_service.get_json('get_demographics', suburb_id)
+        return raw_json_response(body), 200
+    """
+    return Response(body, mimetype='application/json')
@@ -2,12 +2,36 @@
 Request Validators
 Provides input validation utilities for API requests
 """
-import re
 from functools import wraps
 from flask import request
 from typing import Callable, List, Dict, Any
 from .error_handler import ApiError
 
+# Longest suburb ID accepted; anything longer is rejected before parsing
+_MAX_SUBURB_ID_LENGTH = 100
+
+# Accepted spellings of boolean query parameters, compared case-insensitively
+_TRUE_VALUES = frozenset({'true', '1', 'yes'})
+_FALSE_VALUES = frozenset({'false', '0', 'no'})
+
+
+def _is_valid_suburb_id(suburb_id: str) -> bool:
+    """
+    Check suburb ID structure: lowercase words separated by hyphens, ending with optional postcode
+
+    Examples: "melbourne", "melbourne-3000", "belmont-north-2280"
+    """
+    if len(suburb_id) > _MAX_SUBURB_ID_LENGTH or not suburb_id.isascii():
+        return False
+
+    words = suburb_id.split('-')
+    if len(words) > 1 and words[-1].isdigit():
+        if len(words[-1]) != 4:
+            return False
+        words.pop()
+
+    return all(word.isalpha() and word.islower() for word in words)
+
 
 def validate_suburb_id(suburb_id: str) -> None:
     """
@@ -22,11 +46,7 @@ def validate_suburb_id(suburb_id: str) -> None:
     if not suburb_id:
         raise ValueError("Suburb ID is required")
 
-    # Check basic format: lowercase words separated by hyphens, ending with optional postcode
-    # Examples: "melbourne", "melbourne-3000", "belmont-north-2280"
-    pattern = r'^[a-z]+(-[a-z]+)*(-\d{4})?$'
-
-    if not re.match(pattern, suburb_id):
+    if not _is_valid_suburb_id(suburb_id):
         raise ValueError(
             f"Invalid suburb ID format: '{suburb_id}'. "
             "Expected format: 'suburb-name' or 'suburb-name-postcode' (e.g., 'melbourne-3000')"
@@ -102,6 +122,44 @@ def validate_query_params(
     return decorator
 
 
+def search_query_validator(min_length: int = 1, max_length: int = 100) -> Callable[[], None]:
+    """
+    Build a check for the search query parameter 'q'
+
+    Args:
+        min_length: Minimum query length
+        max_length: Maximum query length
+
+    Returns:
+        Callable that raises ApiError if the current request's query is invalid
+
+    Usage:
+        view = compose_view(search_route, validators=(search_query_validator(2, 50),))
+    """
+    def validate():
+        query = request.args.get('q', '')
+
+        if not query:
+            raise ApiError(
+                "Search query parameter 'q' is required",
+                status_code=400
+            )
+
+        if len(query) < min_length:
+            raise ApiError(
+                f"Search query must be at least {min_length} character(s)",
+                status_code=400
+            )
+
+        if len(query) > max_length:
+            raise ApiError(
+                f"Search query must not exceed {max_length} characters",
+                status_code=400
+            )
+
+    return validate
+
+
 def validate_search_query(min_length: int = 1, max_length: int = 100) -> Callable:
     """
     Decorator to validate search query parameter
@@ -120,33 +178,39 @@ def validate_search_query(min_length: int = 1, max_length: int = 100) -> Callabl
             # Your route logic
             pass
     """
+    validate = search_query_validator(min_length, max_length)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            query = request.args.get('q', '')
+            validate()
+            return func(*args, **kwargs)
 
-            if not query:
-                raise ApiError(
-                    "Search query parameter 'q' is required",
-                    status_code=400
-                )
+        return wrapper
+    return decorator
 
-            if len(query) < min_length:
-                raise ApiError(
-                    f"Search query must be at least {min_length} character(s)",
-                    status_code=400
-                )
 
-            if len(query) > max_length:
-                raise ApiError(
-                    f"Search query must not exceed {max_length} characters",
-                    status_code=400
-                )
+def parse_bool_param(args, param_name: str, default: bool = True) -> bool:
+    """
+    Parse boolean query parameter leniently
 
-            return func(*args, **kwargs)
+    Accepts the same spellings as validate_boolean_param, in any casing,
+    but treats unrecognised values as False instead of raising.
 
-        return wrapper
-    return decorator
+    Args:
+        args: Request query arguments (e.g. request.args)
+        param_name: Name of the parameter
+        default: Default value if parameter is missing
+
+    Returns:
+        True if the value is a recognised true spelling, False otherwise
+    """
+    value = args.get(param_name)
+
+    if value is None:
+        return default
+
+    return value.lower() in _TRUE_VALUES
 
 
 def validate_boolean_param(param_name: str, default: bool = True) -> bool:
@@ -170,9 +234,9 @@ def validate_boolean_param(param_name: str, default: bool = True) -> bool:
 
     value_lower = value.lower()
 
-    if value_lower in ['true', '1', 'yes']:
+    if value_lower in _TRUE_VALUES:
         return True
-    elif value_lower in ['false', '0', 'no']:
+    elif value_lower in _FALSE_VALUES:
         return False
     else:
         raise ValueError(
@@ -3,9 +3,10 @@ Amenities Data Transfer Objects
 """
 from dataclasses import dataclass
 from typing import List, Optional
+from .fields import pick_alias, intern_str
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AmenityDTO:
     """Single amenity data"""
     name: str
@@ -31,16 +32,16 @@ class AmenityDTO:
     def from_dict(cls, data: dict) -> 'AmenityDTO':
         return cls(
             name=data.get('name', ''),
-            category=data.get('category', ''),
+            category=intern_str(data.get('category', '')),
             latitude=data.get('latitude'),
             longitude=data.get('longitude'),
             address=data.get('address'),
             rating=data.get('rating'),
-            distance_km=data.get('distance_km', data.get('distanceKm')),
+            distance_km=pick_alias(data, 'distance_km', 'distanceKm'),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AmenitiesDTO:
     """Complete amenities data for a suburb"""
     suburb_id: str
@@ -52,17 +53,25 @@ class AmenitiesDTO:
     public_transport: List[AmenityDTO]
 
     def to_dict(self) -> dict:
+        to_dict = AmenityDTO.to_dict
+        cafes = list(map(to_dict, self.cafes))
+        restaurants = list(map(to_dict, self.restaurants))
+        parks = list(map(to_dict, self.parks))
+        gyms = list(map(to_dict, self.gyms))
+        shopping_centers = list(map(to_dict, self.shopping_centers))
+        public_transport = list(map(to_dict, self.public_transport))
+
         return {
             self.suburb_id: {
-                'cafes': [cafe.to_dict() for cafe in self.cafes],
-                'restaurants': [rest.to_dict() for rest in self.restaurants],
-                'parks': [park.to_dict() for park in self.parks],
-                'gyms': [gym.to_dict() for gym in self.gyms],
-                'shoppingCenters': [shop.to_dict() for shop in self.shopping_centers],
-                'publicTransport': [trans.to_dict() for trans in self.public_transport],
+                'cafes': cafes,
+                'restaurants': restaurants,
+                'parks': parks,
+                'gyms': gyms,
+                'shoppingCenters': shopping_centers,
+                'publicTransport': public_transport,
                 'totalCount': (
-                    len(self.cafes) + len(self.restaurants) + len(self.parks) +
-                    len(self.gyms) + len(self.shopping_centers) + len(self.public_transport)
+                    len(cafes) + len(restaurants) + len(parks) +
+                    len(gyms) + len(shopping_centers) + len(public_transport)
                 ),
             }
         }
@@ -78,6 +87,6 @@ class AmenitiesDTO:
             restaurants=[AmenityDTO.from_dict(item) for item in suburb_data.get('restaurants', [])],
             parks=[AmenityDTO.from_dict(item) for item in suburb_data.get('parks', [])],
             gyms=[AmenityDTO.from_dict(item) for item in suburb_data.get('gyms', [])],
-            shopping_centers=[AmenityDTO.from_dict(item) for item in suburb_data.get('shoppingCenters', suburb_data.get('shopping_centers', []))],
-            public_transport=[AmenityDTO.from_dict(item) for item in suburb_data.get('publicTransport', suburb_data.get('public_transport', []))],
+            shopping_centers=[AmenityDTO.from_dict(item) for item in pick_alias(suburb_data, 'shoppingCenters', 'shopping_centers', [])],
+            public_transport=[AmenityDTO.from_dict(item) for item in pick_alias(suburb_data, 'publicTransport', 'public_transport', [])],
         )
@@ -3,9 +3,10 @@ Demographics Data Transfer Objects
 """
 from dataclasses import dataclass
 from typing import List
+from .fields import pick_alias, intern_str
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class AgeDistributionDTO:
     """Age distribution data"""
     age_range: str
@@ -22,13 +23,13 @@ class AgeDistributionDTO:
     @classmethod
     def from_dict(cls, data: dict) -> 'AgeDistributionDTO':
         return cls(
-            age_range=data.get('age_range', data.get('ageRange', '')),
+            age_range=intern_str(pick_alias(data, 'age_range', 'ageRange', '')),
             percentage=data.get('percentage', 0.0),
             count=data.get('count', 0),
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EthnicityDTO:
     """Ethnicity data"""
     ethnicity: str
@@ -45,13 +46,13 @@ class EthnicityDTO:
     @classmethod
     def from_dict(cls, data: dict) -> 'EthnicityDTO':
         return cls(
-            ethnicity=data.get('ethnicity', ''),
+            ethnicity=intern_str(data.get('ethnicity', '')),
             percentage=data.get('percentage', 0.0),
             count=data.get('count', 0),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DemographicsDTO:
     """Complete demographics data for a suburb"""
     suburb_id: str
@@ -65,8 +66,8 @@ class DemographicsDTO:
     def to_dict(self) -> dict:
         return {
             self.suburb_id: {
-                'ageDistribution': [age.to_dict() for age in self.age_distribution],
-                'ethnicity': [eth.to_dict() for eth in self.ethnicity],
+                'ageDistribution': list(map(AgeDistributionDTO.to_dict, self.age_distribution)),
+                'ethnicity': list(map(EthnicityDTO.to_dict, self.ethnicity)),
                 'medianAge': self.median_age,
                 'medianIncome': self.median_income,
                 'unemploymentRate': self.unemployment_rate,
@@ -81,7 +82,7 @@ class DemographicsDTO:
 
         age_dist = [
             AgeDistributionDTO.from_dict(item)
-            for item in suburb_data.get('ageDistribution', suburb_data.get('age_distribution', []))
+            for item in pick_alias(suburb_data, 'ageDistribution', 'age_distribution', [])
         ]
 
         ethnicity = [
@@ -93,8 +94,8 @@ class DemographicsDTO:
             suburb_id=suburb_id,
             age_distribution=age_dist,
             ethnicity=ethnicity,
-            median_age=suburb_data.get('medianAge', suburb_data.get('median_age', 0)),
-            median_income=suburb_data.get('medianIncome', suburb_data.get('median_income', 0)),
-            unemployment_rate=suburb_data.get('unemploymentRate', suburb_data.get('unemployment_rate', 0.0)),
-            education_level_bachelor_plus=suburb_data.get('educationLevelBachelorPlus', suburb_data.get('education_level_bachelor_plus', 0.0)),
+            median_age=pick_alias(suburb_data, 'medianAge', 'median_age', 0),
+            median_income=pick_alias(suburb_data, 'medianIncome', 'median_income', 0),
+            unemployment_rate=pick_alias(suburb_data, 'unemploymentRate', 'unemployment_rate', 0.0),
+            education_level_bachelor_plus=pick_alias(suburb_data, 'educationLevelBachelorPlus', 'education_level_bachelor_plus', 0.0),
         )
@@ -0,0 +1,61 @@
+"""
+DTO Field Helpers
+Shared helpers for reading fields that arrive under alternative key names
+"""
+import sys
+from typing import Any, Tuple
+
+_MISSING = object()
+
+
+def pick_alias(data: dict, key: str, alias: str, default: Any = None) -> Any:
+    """
+    Read a field that may be stored under either of two key names
+
+    Args:
+        data: Source dictionary
+        key: Preferred key
+        alias: Fallback key, only looked up when the preferred key is absent
+        default: Value returned if neither key is present
+
+    Returns:
+        Field value or default
+    """
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
+        return data.get(alias, default)
+    return value
+
+
+def pick_first(data: dict, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    Read a field that may be stored under any of several key names
+
+    Args:
+        data: Source dictionary
+        keys: Key names in order of preference
+        default: Value returned if none of the keys is present
+
+    Returns:
+        Value of the first key present, or default
+    """
+    for key in keys:
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
+def intern_str(value: Any) -> Any:
+    """
+    Intern strings drawn from a small fixed vocabulary (categories, states)
+
+    Args:
+        value: Field value; non-string values are returned unchanged
+
+    Returns:
+        Interned string or the original value
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
@@ -3,9 +3,10 @@ Suburb Data Transfer Objects
 """
 from dataclasses import dataclass
 from typing import Optional
+from .fields import intern_str
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SuburbSearchResultDTO:
     """DTO for suburb search results"""
     id: str
@@ -42,8 +43,8 @@ class SuburbSearchResultDTO:
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
-            state=data.get('state', ''),
-            postcode=data.get('postcode', ''),
+            state=intern_str(data.get('state', '')),
+            postcode=intern_str(data.get('postcode', '')),
             population=data.get('population', 0),
             median_age=data.get('median_age', 0),
             median_house_price=data.get('median_house_price', 0),
@@ -54,7 +55,7 @@ class SuburbSearchResultDTO:
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SuburbDTO:
     """DTO for detailed suburb information"""
     id: str
@@ -115,8 +116,8 @@ class SuburbDTO:
         return cls(
             id=data.get('id', ''),
             name=data.get('name', ''),
-            state=data.get('state', ''),
-            postcode=data.get('postcode', ''),
+            state=intern_str(data.get('state', '')),
+            postcode=intern_str(data.get('postcode', '')),
             latitude=data.get('latitude'),
             longitude=data.get('longitude'),
             area_sqkm=data.get('area_sqkm'),
@@ -6,10 +6,13 @@ from .base import SuburbRepository
 from .api_repository import ApiSuburbRepository
 from .file_repository import FileSuburbRepository
 from .composite_repository import CompositeSuburbRepository
+from .lookup_watch import LookupWatch, watch_lookups
 
 __all__ = [
     'SuburbRepository',
     'ApiSuburbRepository',
     'FileSuburbRepository',
     'CompositeSuburbRepository',
+    'LookupWatch',
+    'watch_lookups',
 ]
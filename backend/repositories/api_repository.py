@@ -3,16 +3,68 @@ API Repository Implementation
 Fetches data from external Microburbs API
 """
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from .base import SuburbRepository
+from .lookup_watch import note_expiry
 from services.microburbs_api import MicroburbsApiService
+from config import config
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Numeric suffix (postcode) at the end of a suburb ID
+_TRAILING_POSTCODE_RE = re.compile(r'-\d+\Z')
+
+# Shared pool for issuing independent upstream requests in parallel
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='microburbs-api')
+
+
+@lru_cache(maxsize=4096)
+def extract_suburb_name(suburb_id: str) -> str:
+    """
+    Convert a suburb ID into the suburb name expected by the Microburbs API
+
+    Args:
+        suburb_id: Suburb identifier (e.g., 'belmont-north-2280')
+
+    Returns:
+        Title-cased suburb name without postcode (e.g., 'Belmont North')
+    """
+    return _TRAILING_POSTCODE_RE.sub('', suburb_id).replace('-', ' ').title()
+
+
+def _suburb_getter(service_method: str, doc: str, wrap: bool = False):
+    """
+    Build a repository getter that forwards a suburb ID to one API service call
+
+    Args:
+        service_method: Name of the MicroburbsApiService getter
+        doc: Docstring for the generated method
+        wrap: Whether to key the result by suburb_id to match frontend expectations
+
+    Returns:
+        Method taking suburb_id
+    """
+    def getter(self, suburb_id: str) -> Optional[Dict[str, Any]]:
+        data = self._fetch(service_method, extract_suburb_name(suburb_id))
+        if wrap:
+            return {suburb_id: data} if data else None
+        return data
+
+    getter.__doc__ = doc
+    return getter
+
 
 class ApiSuburbRepository(SuburbRepository):
     """Repository that fetches data from Microburbs API"""
 
+    __slots__ = ('api_service', '_cache')
+
     def __init__(self, api_service: MicroburbsApiService = None):
         """
         Initialize API repository
@@ -21,18 +73,44 @@ class ApiSuburbRepository(SuburbRepository):
             api_service: MicroburbsApiService instance (optional, creates new if None)
         """
         self.api_service = api_service or MicroburbsApiService()
+        self._cache = TTLCache(maxsize=config.CACHE_MAX_ENTRIES, ttl=config.CACHE_TTL)
+
+    def _fetch(self, method_name: str, *args) -> Optional[Dict[str, Any]]:
+        """
+        Call an API service getter, caching successful responses
+
+        Responses are cached per (method_name, args) for config.CACHE_TTL
+        seconds, so endpoints sharing an upstream call (e.g. suburb details
+        and suburb info) hit the API once. Failed calls are not cached.
+        Cached responses are shared and must not be mutated. The expiry of
+        the response served is reported to the active watch_lookups() block.
+
+        Args:
+            method_name: Name of the MicroburbsApiService getter
+            *args: Arguments forwarded to the getter
+
+        Returns:
+            API response data, or None if the request failed
+        """
+        key = (method_name, args)
+        entry = self._cache.get_entry(key)
+        if entry is not None:
+            note_expiry(entry[0])
+            return entry[1]
+
+        data = getattr(self.api_service, method_name)(*args)
+        if data is not None:
+            self._cache.set(key, data)
+            note_expiry(time.monotonic() + self._cache.ttl)
+        return data
 
     def _extract_suburb_name(self, suburb_id: str) -> str:
         """Extract suburb name from suburb_id"""
-        parts = suburb_id.split('-')
-        if len(parts) > 1 and parts[-1].isdigit():
-            parts = parts[:-1]
-        suburb_name = ' '.join(parts)
-        return suburb_name.title()
+        return extract_suburb_name(suburb_id)
 
     def search_suburbs(self, query: str) -> List[Dict[str, Any]]:
         """Search for suburbs"""
-        result = self.api_service.search_suburbs(query)
+        result = self._fetch('search_suburbs', query)
         if result and 'results' in result:
             return result['results'][:10]
         return []
@@ -40,24 +118,31 @@ class ApiSuburbRepository(SuburbRepository):
     def get_suburb_info(self, suburb_id: str, geojson: bool = True) -> Optional[Dict[str, Any]]:
         """Get basic suburb information"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_suburb_info(suburb_name, geojson)
+        return self._fetch('get_suburb_info', suburb_name, geojson)
 
-    def get_suburb_summary(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get suburb summary with scores"""
-        suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_suburb_summary(suburb_name)
+    # Getters that map one suburb ID onto one API call
+    get_suburb_summary = _suburb_getter('get_suburb_summary', "Get suburb summary with scores")
+    get_amenities = _suburb_getter('get_suburb_amenities', "Get amenities data", wrap=True)
+    get_market_trends = _suburb_getter('get_suburb_market_data', "Get market trends", wrap=True)
+    get_schools = _suburb_getter('get_suburb_schools', "Get schools data", wrap=True)
+    get_developments = _suburb_getter('get_suburb_development', "Get development applications", wrap=True)
 
     def get_demographics(self, suburb_id: str) -> Optional[Dict[str, Any]]:
         """Get demographics data including ethnicity"""
         suburb_name = self._extract_suburb_name(suburb_id)
         
-        # Get demographics data (age brackets)
-        data = self.api_service.get_suburb_demographics(suburb_name)
+        # Fetch demographics (age brackets) and ethnicity concurrently;
+        # the two upstream calls are independent
+        ethnicity_future = _executor.submit(copy_context().run, self._fetch, 'get_suburb_ethnicity', suburb_name)
+        data = self._fetch('get_suburb_demographics', suburb_name)
         if not data:
+            ethnicity_future.cancel()
             return None
         
-        # Get ethnicity data separately
-        ethnicity_data = self.api_service.get_suburb_ethnicity(suburb_name)
+        ethnicity_data = ethnicity_future.result()
+        
+        # Copy before merging so the cached API response is left untouched
+        data = dict(data)
         
         # Merge ethnicity data into demographics if available
         if ethnicity_data:
@@ -72,34 +157,6 @@ class ApiSuburbRepository(SuburbRepository):
         # Wrap in suburb_id key to match frontend expectations
         return {suburb_id: data}
 
-    def get_amenities(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get amenities data"""
-        suburb_name = self._extract_suburb_name(suburb_id)
-        data = self.api_service.get_suburb_amenities(suburb_name)
-        # Wrap in suburb_id key to match frontend expectations
-        return {suburb_id: data} if data else None
-
-    def get_market_trends(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get market trends"""
-        suburb_name = self._extract_suburb_name(suburb_id)
-        data = self.api_service.get_suburb_market_data(suburb_name)
-        # Wrap in suburb_id key to match frontend expectations
-        return {suburb_id: data} if data else None
-
-    def get_schools(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get schools data"""
-        suburb_name = self._extract_suburb_name(suburb_id)
-        data = self.api_service.get_suburb_schools(suburb_name)
-        # Wrap in suburb_id key to match frontend expectations
-        return {suburb_id: data} if data else None
-
-    def get_developments(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get development applications"""
-        suburb_name = self._extract_suburb_name(suburb_id)
-        data = self.api_service.get_suburb_development(suburb_name)
-        # Wrap in suburb_id key to match frontend expectations
-        return {suburb_id: data} if data else None
-
     def get_market_insights(
         self,
         suburb_id: str,
@@ -108,7 +165,7 @@ class ApiSuburbRepository(SuburbRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get market insights"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_suburb_market_insights(suburb_name, metric, property_type)
+        return self._fetch('get_suburb_market_insights', suburb_name, metric, property_type)
 
     def get_pocket_insights(
         self,
@@ -118,7 +175,7 @@ class ApiSuburbRepository(SuburbRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get pocket-level insights"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_suburb_pocket_insights(suburb_name, geojson, property_type)
+        return self._fetch('get_suburb_pocket_insights', suburb_name, geojson, property_type)
 
     def get_street_insights(
         self,
@@ -128,7 +185,7 @@ class ApiSuburbRepository(SuburbRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get street-level insights"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        data = self.api_service.get_suburb_street_insights(suburb_name, property_type)
+        data = self._fetch('get_suburb_street_insights', suburb_name, property_type)
         # Wrap in suburb_id key to match frontend expectations
         return {suburb_id: data} if data else None
 
@@ -139,7 +196,7 @@ class ApiSuburbRepository(SuburbRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get risk factors"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_suburb_risk(suburb_name)
+        return self._fetch('get_suburb_risk', suburb_name)
 
     def get_school_catchments(
         self,
@@ -148,7 +205,7 @@ class ApiSuburbRepository(SuburbRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get school catchment areas"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_suburb_catchments(suburb_name, geojson)
+        return self._fetch('get_suburb_catchments', suburb_name, geojson)
 
     def get_zoning(
         self,
@@ -157,7 +214,7 @@ class ApiSuburbRepository(SuburbRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get zoning information"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_suburb_zoning(suburb_name, geojson)
+        return self._fetch('get_suburb_zoning', suburb_name, geojson)
 
     def get_similar_suburbs(
         self,
@@ -166,7 +223,7 @@ class ApiSuburbRepository(SuburbRepository):
     ) -> Optional[Dict[str, Any]]:
         """Get similar suburbs"""
         suburb_name = self._extract_suburb_name(suburb_id)
-        return self.api_service.get_similar_suburbs(suburb_name, geojson)
+        return self._fetch('get_similar_suburbs', suburb_name, geojson)
     def get_street_rankings(
         self,
         suburb_id: str,
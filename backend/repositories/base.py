@@ -9,6 +9,8 @@ from typing import List, Optional, Dict, Any
 class SuburbRepository(ABC):
     """Abstract base class for suburb data repositories"""
 
+    __slots__ = ()
+
     @abstractmethod
     def search_suburbs(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -3,19 +3,81 @@ Composite Repository Implementation
 Combines API and File repositories with fallback mechanism
 """
 import logging
-from typing import List, Optional, Dict, Any
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Optional, Dict, Any, Tuple
 from .base import SuburbRepository
 from .api_repository import ApiSuburbRepository
 from .file_repository import FileSuburbRepository
+from .lookup_watch import LookupWatch, watch_lookups, note_lookup
+from config import config
+from utils.cache import TTLCache
+from utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Runs API lookups so callers can stop waiting at the soft deadline
+# (separate from the API repository's pool, which these calls may use)
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='composite-api')
+
+# Warms the sections of a suburb page while the first section is being served
+_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='composite-prefetch')
+
+# Methods fetched in the background once a suburb's info is requested
+PREFETCH_METHODS = (
+    'get_suburb_summary',
+    'get_market_trends',
+    'get_demographics',
+    'get_amenities',
+    'get_schools',
+)
+
+
+def _fallback_method(method_name: str, **optional: Any):
+    """
+    Build a suburb getter that runs the API-then-file chain for one repository method
+
+    Args:
+        method_name: Repository method name
+        **optional: Optional parameters of the method and their defaults, in signature order
+
+    Returns:
+        Method taking suburb_id plus the optional parameters, positionally or by keyword
+    """
+    names = tuple(optional)
+
+    def method(self, suburb_id: str, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        if len(args) > len(names):
+            raise TypeError(f"{method_name}() takes at most {len(names) + 1} positional arguments")
+
+        # Always forward every optional parameter by keyword, so equivalent
+        # calls share fallback, stale-data and in-flight keys
+        params = dict(optional)
+        params.update(zip(names, args))
+        params.update(kwargs)
+        return self._try_api_then_file(method_name, suburb_id, **params)
+
+    method.__name__ = method_name
+    method.__doc__ = f"{method_name.replace('_', ' ').capitalize()} (API first, then file)"
+    return method
+
 
 class CompositeSuburbRepository(SuburbRepository):
     """
     Repository that tries API first, falls back to file if API fails
     """
 
+    __slots__ = (
+        'api_repo',
+        'file_repo',
+        '_methods',
+        'soft_timeout',
+        '_last_good',
+        '_inflight',
+        'prefetch_enabled',
+        '_prefetched',
+    )
+
     def __init__(
         self,
         api_repo: ApiSuburbRepository = None,
@@ -30,6 +92,86 @@ class CompositeSuburbRepository(SuburbRepository):
         """
         self.api_repo = api_repo or ApiSuburbRepository()
         self.file_repo = file_repo or FileSuburbRepository()
+        # Bound (api, file) method pairs per repository method, resolved once
+        self._methods = {
+            name: (getattr(self.api_repo, name), getattr(self.file_repo, name))
+            for name in SuburbRepository.__abstractmethods__
+        }
+        self.soft_timeout = config.API_SOFT_TIMEOUT
+        # Last successful API answer per call, served if the API later fails
+        self._last_good = TTLCache(maxsize=config.CACHE_MAX_ENTRIES, ttl=config.CACHE_STALE_TTL)
+        # Concurrent identical lookups share one API/file round
+        self._inflight = SingleFlight()
+        # Suburbs prefetched recently, so repeat visits do not queue the same work
+        self.prefetch_enabled = config.API_PREFETCH
+        self._prefetched = TTLCache(maxsize=config.CACHE_MAX_ENTRIES, ttl=config.CACHE_TTL)
+
+    def _prefetch(self, suburb_id: str) -> None:
+        """
+        Start background API calls for the rest of a suburb page
+
+        Only live data is warmed: results land in the API repository cache
+        (a real request arriving mid-prefetch joins the same upstream call),
+        so the page's follow-up calls do not each wait for a full API round
+        trip. File fallback data is never fetched or cached here.
+
+        Args:
+            suburb_id: Suburb identifier
+        """
+        if not self.prefetch_enabled or suburb_id in self._prefetched:
+            return
+        self._prefetched.set(suburb_id, True)
+
+        for method_name in PREFETCH_METHODS:
+            _prefetch_executor.submit(self._prefetch_one, method_name, suburb_id)
+
+    def _prefetch_one(self, method_name: str, suburb_id: str) -> None:
+        """Run one prefetch API call, discarding the result"""
+        try:
+            self._call_api(method_name, suburb_id)
+        except Exception as e:
+            logger.debug("Prefetch of %s for %s failed: %s", method_name, suburb_id, e)
+
+    def _call_api(self, method_name: str, *args, **kwargs) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Call API repository method, logging and swallowing failures
+
+        Successful results are remembered for config.CACHE_STALE_TTL seconds;
+        if a later call raises or returns None, the remembered result is
+        returned instead so live data is preferred over fallback files. A
+        successful empty answer replaces nothing and is returned as is.
+
+        Returns:
+            (data, live) where live is True only for a fresh API answer
+        """
+        key = (method_name, args, tuple(sorted(kwargs.items())))
+        try:
+            result = self._methods[method_name][0](*args, **kwargs)
+        except Exception as e:
+            logger.warning("API call failed for %s: %s", method_name, e)
+            result = None
+
+        if result is not None:
+            if result:
+                self._last_good.set(key, result)
+            else:
+                # The API answered with no data; older data is no longer good
+                self._last_good.pop(key)
+            return result, True
+
+        stale = self._last_good.get(key)
+        if stale is not None:
+            logger.warning("Serving last successful API data for %s", method_name)
+            return stale, False
+        return result, False
+
+    def _call_file(self, method_name: str, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        """Call file repository method, logging and swallowing failures"""
+        try:
+            return self._methods[method_name][1](*args, **kwargs)
+        except Exception as e:
+            logger.error("File fallback failed for %s: %s", method_name, e)
+            return None
 
     def _try_api_then_file(
         self,
@@ -40,6 +182,14 @@ class CompositeSuburbRepository(SuburbRepository):
         """
         Try API repository first, fallback to file repository
 
+        Concurrent calls with identical arguments are coalesced into one
+        lookup whose result is shared; API responses themselves are cached
+        by the API repository. If the API has not answered within the soft
+        timeout, file data is returned instead of waiting for the full API
+        timeout. The API call keeps running in the background and its
+        response is cached for later requests. Where the data came from is
+        reported to the active watch_lookups() block, if any.
+
         Args:
             method_name: Name of the repository method to call
             *args: Positional arguments for the method
@@ -48,175 +198,98 @@ class CompositeSuburbRepository(SuburbRepository):
         Returns:
             Data from API or file, or None
         """
-        # Try API first
+        key = (method_name, args, tuple(sorted(kwargs.items())))
+        result, lookup = self._inflight.do(key, self._lookup, method_name, *args, **kwargs)
+        note_lookup(lookup)
+        return result
+
+    def _lookup(
+        self,
+        method_name: str,
+        *args,
+        **kwargs
+    ) -> Tuple[Optional[Dict[str, Any]], LookupWatch]:
+        """
+        Run one API-then-file lookup (see _try_api_then_file)
+
+        Returns:
+            (data, watch) where watch records where the data came from, so
+            callers sharing the lookup can report it too
+        """
+        with watch_lookups() as watch:
+            result, live = self._lookup_data(method_name, *args, **kwargs)
+            if result and not live:
+                watch.fallback = True
+        return result, watch
+
+    def _lookup_data(
+        self,
+        method_name: str,
+        *args,
+        **kwargs
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Try the API within the soft timeout, then the file repository
+
+        Returns:
+            (data, live) where live is True only for a fresh API answer
+        """
+        # Try API first, in this context so the API repository reports to our watch
+        api_future = _executor.submit(copy_context().run, self._call_api, method_name, *args, **kwargs)
         try:
-            api_method = getattr(self.api_repo, method_name)
-            result = api_method(*args, **kwargs)
+            result, live = api_future.result(timeout=self.soft_timeout)
+        except FutureTimeoutError:
+            logger.warning("API slower than %ss for %s, trying file fallback", self.soft_timeout, method_name)
+            result = self._call_file(method_name, *args, **kwargs)
             if result:
-                logger.debug(f"Data retrieved from API: {method_name}")
-                return result
-            logger.debug(f"API returned no data for: {method_name}")
-        except Exception as e:
-            logger.warning(f"API call failed for {method_name}: {str(e)}")
+                logger.info("Data retrieved from file fallback: %s", method_name)
+                return result, False
 
-        # Fallback to file
-        try:
-            file_method = getattr(self.file_repo, method_name)
-            result = file_method(*args, **kwargs)
+            # No local data, so the API answer is still worth waiting for
+            result, live = api_future.result()
             if result:
-                logger.info(f"Data retrieved from file fallback: {method_name}")
-                return result
-            logger.debug(f"File fallback returned no data for: {method_name}")
-        except Exception as e:
-            logger.error(f"File fallback failed for {method_name}: {str(e)}")
+                logger.debug("Data retrieved from API: %s", method_name)
+                return result, live
+            logger.debug("API returned no data for: %s", method_name)
+            return None, False
+
+        if result:
+            logger.debug("Data retrieved from API: %s", method_name)
+            return result, live
+        logger.debug("API returned no data for: %s", method_name)
 
-        return None
+        # Fallback to file
+        result = self._call_file(method_name, *args, **kwargs)
+        if result:
+            logger.info("Data retrieved from file fallback: %s", method_name)
+            return result, False
+        logger.debug("File fallback returned no data for: %s", method_name)
+
+        return None, False
 
     def search_suburbs(self, query: str) -> List[Dict[str, Any]]:
         """Search for suburbs (API first, then file)"""
         result = self._try_api_then_file('search_suburbs', query)
         return result if result else []
 
-    def get_suburb_info(self, suburb_id: str, geojson: bool = True) -> Optional[Dict[str, Any]]:
-        """Get suburb info (API first, then file)"""
-        return self._try_api_then_file('get_suburb_info', suburb_id, geojson=geojson)
-
-    def get_suburb_summary(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get suburb summary (API first, then file)"""
-        return self._try_api_then_file('get_suburb_summary', suburb_id)
-
-    def get_demographics(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get demographics (API first, then file)"""
-        return self._try_api_then_file('get_demographics', suburb_id)
-
-    def get_amenities(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get amenities (API first, then file)"""
-        return self._try_api_then_file('get_amenities', suburb_id)
+    # Suburb getters, each forwarding its optional parameters (with defaults) to the fallback chain
+    _get_suburb_info = _fallback_method('get_suburb_info', geojson=True)
+    get_suburb_summary = _fallback_method('get_suburb_summary')
+    get_demographics = _fallback_method('get_demographics')
+    get_amenities = _fallback_method('get_amenities')
+    get_market_trends = _fallback_method('get_market_trends')
+    get_schools = _fallback_method('get_schools')
+    get_developments = _fallback_method('get_developments')
+    get_market_insights = _fallback_method('get_market_insights', metric=None, property_type=None)
+    get_pocket_insights = _fallback_method('get_pocket_insights', geojson=True, property_type=None)
+    get_street_insights = _fallback_method('get_street_insights', geojson=True, property_type=None)
+    get_risk_factors = _fallback_method('get_risk_factors', geojson=True)
+    get_school_catchments = _fallback_method('get_school_catchments', geojson=True)
+    get_zoning = _fallback_method('get_zoning', geojson=True)
+    get_similar_suburbs = _fallback_method('get_similar_suburbs', geojson=True)
+    get_street_rankings = _fallback_method('get_street_rankings', property_type=None)
 
-    def get_market_trends(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get market trends (API first, then file)"""
-        return self._try_api_then_file('get_market_trends', suburb_id)
-
-    def get_schools(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get schools (API first, then file)"""
-        return self._try_api_then_file('get_schools', suburb_id)
-
-    def get_developments(self, suburb_id: str) -> Optional[Dict[str, Any]]:
-        """Get developments (API first, then file)"""
-        return self._try_api_then_file('get_developments', suburb_id)
-
-    def get_market_insights(
-        self,
-        suburb_id: str,
-        metric: Optional[str] = None,
-        property_type: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Get market insights (API first, then file)"""
-        return self._try_api_then_file(
-            'get_market_insights',
-            suburb_id,
-            metric=metric,
-            property_type=property_type
-        )
-
-    def get_pocket_insights(
-        self,
-        suburb_id: str,
-        geojson: bool = True,
-        property_type: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Get pocket insights (API first, then file)"""
-        return self._try_api_then_file(
-            'get_pocket_insights',
-            suburb_id,
-            geojson=geojson,
-            property_type=property_type
-        )
-
-    def get_street_insights(
-        self,
-        suburb_id: str,
-        geojson: bool = True,
-        property_type: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Get street insights (API first, then file)"""
-        return self._try_api_then_file(
-            'get_street_insights',
-            suburb_id,
-            geojson=geojson,
-            property_type=property_type
-        )
-
-    def get_risk_factors(
-        self,
-        suburb_id: str,
-        geojson: bool = True
-    ) -> Optional[Dict[str, Any]]:
-        """Get risk factors (API first, then file)"""
-        return self._try_api_then_file(
-            'get_risk_factors',
-            suburb_id,
-            geojson=geojson
-        )
-
-    def get_school_catchments(
-        self,
-        suburb_id: str,
-        geojson: bool = True
-    ) -> Optional[Dict[str, Any]]:
-        """Get school catchments (API first, then file)"""
-        return self._try_api_then_file(
-            'get_school_catchments',
-            suburb_id,
-            geojson=geojson
-        )
-
-    def get_zoning(
-        self,
-        suburb_id: str,
-        geojson: bool = True
-    ) -> Optional[Dict[str, Any]]:
-        """Get zoning (API first, then file)"""
-        return self._try_api_then_file(
-            'get_zoning',
-            suburb_id,
-            geojson=geojson
-        )
-
-    def get_similar_suburbs(
-        self,
-        suburb_id: str,
-        geojson: bool = True
-    ) -> Optional[Dict[str, Any]]:
-        """Get similar suburbs (API first, then file)"""
-        return self._try_api_then_file(
-            'get_similar_suburbs',
-            suburb_id,
-            geojson=geojson
-        )
-
-    def get_street_rankings(
-        self,
-        suburb_id: str,
-        property_type: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Get street rankings (API first, then file)"""
-        return self._try_api_then_file(
-            'get_street_rankings',
-            suburb_id,
-            property_type=property_type
-        )
-    
-    def get_street_rankings(
-        self,
-        suburb_id: str,
-        property_type: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Get street rankings"""
-        # Try API repository first
-        result = self.api_repo.get_street_rankings(suburb_id, property_type)
-        if result:
-            return result
-        
-        # Fall back to file repository
-        return self.file_repo.get_street_rankings(suburb_id, property_type)
+    def get_suburb_info(self, suburb_id: str, geojson: bool = True) -> Optional[Dict[str, Any]]:
+        """Get suburb info (API first, then file), prefetching the rest of the suburb page"""
+        self._prefetch(suburb_id)
+        return self._get_suburb_info(suburb_id, geojson)
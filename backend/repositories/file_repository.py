@@ -2,26 +2,78 @@
 File Repository Implementation
 Fetches data from local JSON files (fallback mechanism)
 """
-import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
+import orjson
 from .base import SuburbRepository
 from config import config
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Threads used to read data files in parallel
+_PRELOAD_WORKERS = 8
+
 
 class FileSuburbRepository(SuburbRepository):
     """Repository that fetches data from local JSON files"""
 
+    __slots__ = ('data_dir',)
+
+    # Parsed files keyed by path, stored as (mtime, data) and reused until the file changes
+    _MAX_CACHED_FILES = 32
+    _cache: 'OrderedDict[str, tuple]' = OrderedDict()
+    _lock = threading.Lock()
+
     def __init__(self):
         """Initialize file repository"""
         self.data_dir = config.DATA_DIR
+        self._preload()
+
+    def _preload(self) -> None:
+        """Parse all JSON files in the data directory once, so requests start warm"""
+        try:
+            filenames = sorted(
+                entry.name for entry in os.scandir(self.data_dir)
+                if entry.is_file() and entry.name.endswith('.json')
+            )
+        except FileNotFoundError:
+            logger.debug("Data directory not found: %s", self.data_dir)
+            return
+
+        loaded = self.preload(filenames[:self._MAX_CACHED_FILES])
+        logger.info("Preloaded %s fallback data files", loaded)
+
+    def preload(self, filenames: List[str]) -> int:
+        """
+        Load several files into the cache, reading them in parallel
+
+        Args:
+            filenames: JSON filenames
+
+        Returns:
+            Number of files loaded
+
+        Usage:
+            repo.preload(['suburb_info.json', 'demographics.json'])
+        """
+        if not filenames:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(len(filenames), _PRELOAD_WORKERS)) as executor:
+            return sum(data is not None for data in executor.map(self._load_file, filenames))
 
     def _load_file(self, filename: str) -> Optional[Dict[str, Any]]:
         """
         Load data from JSON file
 
+        Parsed data is cached per file and reused while the file's mtime is
+        unchanged. Returned data is shared and must not be mutated.
+
         Args:
             filename: JSON filename
 
@@ -30,20 +82,58 @@ class FileSuburbRepository(SuburbRepository):
         """
         try:
             file_path = config.get_data_path(filename)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"Loaded data from file: {filename}")
-                return data
+            mtime = os.stat(file_path).st_mtime
+
+            with self._lock:
+                cached = self._cache.get(file_path)
+                if cached is not None and cached[0] == mtime:
+                    self._cache.move_to_end(file_path)
+                    return cached[1]
+
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+                logger.debug("Loaded data from file: %s", filename)
+
+            with self._lock:
+                self._cache[file_path] = (mtime, data)
+                self._cache.move_to_end(file_path)
+                while len(self._cache) > self._MAX_CACHED_FILES:
+                    self._cache.popitem(last=False)
+            return data
         except FileNotFoundError:
-            logger.debug(f"File not found: {filename}")
+            logger.debug("File not found: %s", filename)
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON from {filename}: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON from %s: %s", filename, e)
             return None
         except Exception as e:
-            logger.error(f"Failed to load file {filename}: {str(e)}")
+            logger.error("Failed to load file %s: %s", filename, e)
             return None
 
+    def _get_suburb_record(self, filename: str, suburb_id: str, empty: Any) -> Dict[str, Any]:
+        """
+        Get one suburb's record from a file keyed by suburb ID
+
+        Args:
+            filename: JSON filename
+            suburb_id: Suburb identifier
+            empty: Record returned if the file is missing or empty
+
+        Returns:
+            {suburb_id: record}, using the first suburb's record if suburb_id is not in the file
+        """
+        data = self._load_file(filename)
+        if not data:
+            return {suburb_id: empty}
+
+        record = data.get(suburb_id, _MISSING)
+        if record is _MISSING:
+            # If suburb_id not found, use first available suburb's data
+            first_key = next(iter(data))
+            logger.info("Using fallback data from %s for %s", first_key, suburb_id)
+            record = data[first_key]
+        return {suburb_id: record}
+
     def search_suburbs(self, query: str) -> List[Dict[str, Any]]:
         """Search for suburbs in local data"""
         data = self._load_file('suburbs.json')
@@ -76,83 +166,28 @@ class FileSuburbRepository(SuburbRepository):
 
     def get_demographics(self, suburb_id: str) -> Optional[Dict[str, Any]]:
         """Get demographics data from file"""
-        data = self._load_file('demographics.json')
-        if data and suburb_id in data:
-            return {suburb_id: data[suburb_id]}
-        
-        # If suburb_id not found, use first available suburb's data
-        if data:
-            first_key = next(iter(data.keys()))
-            logger.info(f"Using fallback data from {first_key} for {suburb_id}")
-            return {suburb_id: data[first_key]}
-        
-        # Return empty structure
-        return {suburb_id: {'ageDistribution': [], 'ethnicity': []}}
+        return self._get_suburb_record('demographics.json', suburb_id, {'ageDistribution': [], 'ethnicity': []})
 
     def get_amenities(self, suburb_id: str) -> Optional[Dict[str, Any]]:
         """Get amenities data from file"""
-        data = self._load_file('amenities.json')
-        if data and suburb_id in data:
-            return {suburb_id: data[suburb_id]}
-        
-        # If suburb_id not found, use first available suburb's data
-        if data:
-            first_key = next(iter(data.keys()))
-            logger.info(f"Using fallback data from {first_key} for {suburb_id}")
-            return {suburb_id: data[first_key]}
-        
-        # Return empty structure
-        return {suburb_id: {'categories': [], 'total': 0}}
+        return self._get_suburb_record('amenities.json', suburb_id, {'categories': [], 'total': 0})
 
     def get_market_trends(self, suburb_id: str) -> Optional[Dict[str, Any]]:
         """Get market trends from file"""
-        data = self._load_file('market_trends.json')
-        if data and suburb_id in data:
-            return {suburb_id: data[suburb_id]}
-        
-        # If suburb_id not found, use first available suburb's data
-        if data:
-            first_key = next(iter(data.keys()))
-            logger.info(f"Using fallback data from {first_key} for {suburb_id}")
-            return {suburb_id: data[first_key]}
-        
-        # Return empty structure
-        return {suburb_id: {
+        return self._get_suburb_record('market_trends.json', suburb_id, {
             'priceHistory': [],
             'quarterlyGrowth': 0,
             'rentalYield': 0,
             'daysOnMarket': 0
-        }}
+        })
 
     def get_schools(self, suburb_id: str) -> Optional[Dict[str, Any]]:
         """Get schools data from file"""
-        data = self._load_file('schools.json')
-        if data and suburb_id in data:
-            return {suburb_id: data[suburb_id]}
-        
-        # If suburb_id not found, use first available suburb's data
-        if data:
-            first_key = next(iter(data.keys()))
-            logger.info(f"Using fallback data from {first_key} for {suburb_id}")
-            return {suburb_id: data[first_key]}
-        
-        # Return empty structure
-        return {suburb_id: {'schools': [], 'total': 0}}
+        return self._get_suburb_record('schools.json', suburb_id, {'schools': [], 'total': 0})
 
     def get_developments(self, suburb_id: str) -> Optional[Dict[str, Any]]:
         """Get development applications from file"""
-        data = self._load_file('developments.json')
-        if data and suburb_id in data:
-            return {suburb_id: data[suburb_id]}
-        
-        # If suburb_id not found, use first available suburb's data
-        if data:
-            first_key = next(iter(data.keys()))
-            logger.info(f"Using fallback data from {first_key} for {suburb_id}")
-            return {suburb_id: data[first_key]}
-        
-        # Return empty structure
-        return {suburb_id: {'developments': [], 'total': 0, 'showing': 0}}
+        return self._get_suburb_record('developments.json', suburb_id, {'developments': [], 'total': 0, 'showing': 0})
 
     def get_market_insights(
         self,
@@ -0,0 +1,74 @@
+"""
+Lookup Watch
+Reports where the repository data read during a request came from
+"""
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class LookupWatch:
+    """What the repository lookups in a watch_lookups() block were served from"""
+
+    __slots__ = ('fallback', 'expires_at')
+
+    def __init__(self):
+        # Whether any answer came from fallback files or stale API data
+        self.fallback = False
+        # Earliest time.monotonic() expiry of the cached API responses read
+        self.expires_at = math.inf
+
+    def merge(self, other: 'LookupWatch') -> None:
+        """Fold another watch's observations into this one"""
+        self.fallback = self.fallback or other.fallback
+        self.expires_at = min(self.expires_at, other.expires_at)
+
+
+# Watch of the current lookup, if any (see watch_lookups)
+_current_watch: ContextVar[Optional[LookupWatch]] = ContextVar('lookup_watch', default=None)
+
+
+@contextmanager
+def watch_lookups() -> Iterator[LookupWatch]:
+    """
+    Track the origin and lifetime of repository data read in the block
+
+    Callers that cache results derived from repository data use this to
+    skip caching fallback answers and to expire no later than the API
+    responses they were built from. Work handed to other threads must run
+    in a copy of the caller's context (contextvars.copy_context) to be seen.
+
+    Usage:
+        with watch_lookups() as lookup:
+            data = repo.get_demographics(suburb_id)
+        if not lookup.fallback:
+            cache.set(key, data, ttl=lookup.expires_at - time.monotonic())
+    """
+    watch = LookupWatch()
+    token = _current_watch.set(watch)
+    try:
+        yield watch
+    finally:
+        _current_watch.reset(token)
+
+
+def note_fallback() -> None:
+    """Record that a fallback answer was served to the current watch, if any"""
+    watch = _current_watch.get()
+    if watch is not None:
+        watch.fallback = True
+
+
+def note_expiry(expires_at: float) -> None:
+    """Record the expiry of an API response read by the current watch, if any"""
+    watch = _current_watch.get()
+    if watch is not None and expires_at < watch.expires_at:
+        watch.expires_at = expires_at
+
+
+def note_lookup(other: LookupWatch) -> None:
+    """Fold a finished lookup's watch into the current watch, if any"""
+    watch = _current_watch.get()
+    if watch is not None:
+        watch.merge(other)
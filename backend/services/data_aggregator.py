@@ -2,20 +2,42 @@
 Data Aggregator Service
 Aggregates multiple API calls, transforms data formats, and provides fallback mechanisms
 """
-import json
 import logging
-import sys
-import os
+import math
+import time
+from bisect import bisect_left
+from collections import Counter
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from itertools import islice
+from operator import itemgetter
 from repositories.composite_repository import CompositeSuburbRepository
+from repositories.lookup_watch import watch_lookups
 from config import config
+from utils.json_provider import dumps_json
+from utils.cache import TTLCache
+from models.fields import pick_alias, pick_first
 
 logger = logging.getLogger(__name__)
 
+# Development applications returned per suburb
+MAX_DEVELOPMENTS = 50
+
+# Schools returned per suburb
+MAX_SCHOOLS = 100
+
+# Keys a development application's date may arrive under, in order of preference
+_DEVELOPMENT_DATE_KEYS = ('date', 'lodgement_date', 'submitted_date')
+
+# Suburb detail fields filled from market metrics
+_METRIC_FIELDS = {
+    'sell_price': 'medianHousePrice',
+    'rent_price': 'medianRent',
+}
+
+# Sort key of price series points (ISO date strings)
+_point_date = itemgetter('date')
+
 
 class DataAggregatorService:
     """Service for data aggregation and transformation"""
@@ -30,6 +52,41 @@ class DataAggregatorService:
         # Use Repository pattern instead of direct API service
         self.repo = repository or CompositeSuburbRepository()
         self.use_mock_data = config.USE_MOCK_DATA
+        self._json_cache = TTLCache(maxsize=config.CACHE_MAX_ENTRIES, ttl=config.CACHE_TTL)
+
+    def get_json(self, method_name: str, *args) -> Optional[bytes]:
+        """
+        Get the result of a service getter pre-serialized as JSON bytes
+
+        Serialized results are cached per (method_name, args) for up to
+        config.CACHE_TTL seconds, and never longer than the cached API
+        responses they were built from, so repeat requests skip both the
+        repository fetch and serialization. Empty results, and results built
+        from fallback files or stale API data, are not cached.
+
+        Args:
+            method_name: Name of the getter (e.g. 'get_demographics')
+            *args: Arguments forwarded to the getter
+
+        Returns:
+            UTF-8 JSON bytes, or None if the getter returned no data
+        """
+        key = (method_name, args)
+        body = self._json_cache.get(key)
+        if body is not None:
+            return body
+
+        with watch_lookups() as lookup:
+            data = getattr(self, method_name)(*args)
+        if not data:
+            return None
+
+        body = dumps_json(data)
+        if not lookup.fallback:
+            ttl = min(self._json_cache.ttl, lookup.expires_at - time.monotonic())
+            if ttl > 0:
+                self._json_cache.set(key, body, ttl=ttl)
+        return body
 
     def search_suburbs(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -127,11 +184,10 @@ class DataAggregatorService:
         Returns:
             Aggregated suburb data
         """
-        # Extract suburb name from ID
-        parts = suburb_id.split('-')
-        if len(parts) > 1 and parts[-1].isdigit():
-            parts = parts[:-1]
-        suburb_name = ' '.join(parts).title()
+        # Extract suburb name from ID, dropping a trailing postcode
+        head, sep, tail = suburb_id.rpartition('-')
+        base = head if sep and tail.isdigit() else suburb_id
+        suburb_name = base.replace('-', ' ').title()
 
         result = {
             'id': suburb_id,
@@ -172,10 +228,9 @@ class DataAggregatorService:
                     # Second level contains actual data
                     for item in market_results[0]:
                         if isinstance(item, dict):
-                            if item.get('metric') == 'sell_price':
-                                result['medianHousePrice'] = int(item.get('value', 0))
-                            elif item.get('metric') == 'rent_price':
-                                result['medianRent'] = int(item.get('value', 0))
+                            field = _METRIC_FIELDS.get(item.get('metric'))
+                            if field:
+                                result[field] = int(item.get('value', 0))
 
         return result
 
@@ -217,8 +272,8 @@ class DataAggregatorService:
         if 'ethnicities' in raw_data:
             for eth in raw_data['ethnicities'][:10]:  # Top 10
                 transformed['ethnicity'].append({
-                    'name': eth.get('ethnicity', eth.get('name', '')),
-                    'percentage': round(eth.get('proportion', eth.get('percentage', 0)) * 100, 1)
+                    'name': pick_alias(eth, 'ethnicity', 'name', ''),
+                    'percentage': round(pick_alias(eth, 'proportion', 'percentage', 0) * 100, 1)
                 })
         # Handle new API format with results array
         elif 'results' in raw_data:
@@ -292,10 +347,7 @@ class DataAggregatorService:
         if 'results' in raw_data:
             results = raw_data['results']
             # Count by category
-            category_counts = {}
-            for item in results:
-                category = item.get('category', 'Other')
-                category_counts[category] = category_counts.get(category, 0) + 1
+            category_counts = Counter(item.get('category', 'Other') for item in results)
             
             total = len(results)
             categories = [
@@ -304,7 +356,7 @@ class DataAggregatorService:
                     'count': count,
                     'percentage': round((count / total * 100) if total > 0 else 0, 1)
                 }
-                for cat, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
+                for cat, count in category_counts.most_common()
             ]
             
             return {
@@ -350,7 +402,7 @@ class DataAggregatorService:
         Returns:
             List of {date, suburb, cr, sa3} dictionaries
         """
-        # Group data by date
+        # Group data by date (first record per date wins)
         price_by_date = {}
         
         for item in results:
@@ -362,24 +414,18 @@ class DataAggregatorService:
                 continue
             
             date = item.get('date', '')
-            if not date:
+            if not date or date in price_by_date:
                 continue
             
-            suburb_price = float(item.get('value', 0))
-            cr_price = float(item.get('cr', {}).get('value', 0))
-            sa3_price = float(item.get('sa3', {}).get('value', 0))
-            
-            if date not in price_by_date:
-                price_by_date[date] = {
-                    'date': date,
-                    'suburb': suburb_price,
-                    'cr': cr_price,
-                    'sa3': sa3_price
-                }
+            price_by_date[date] = {
+                'date': date,
+                'suburb': float(item.get('value', 0)),
+                'cr': float(item.get('cr', {}).get('value', 0)),
+                'sa3': float(item.get('sa3', {}).get('value', 0))
+            }
         
         # Sort by date and return as list
-        sorted_data = sorted(price_by_date.values(), key=lambda x: x['date'])
-        return sorted_data
+        return sorted(price_by_date.values(), key=_point_date)
     
     
     def _calculate_current_metrics(self, series: List[Dict]) -> Dict:
@@ -397,26 +443,15 @@ class DataAggregatorService:
         
         current_price = series[-1]['suburb']
         
-        # Find prices from 1 year ago and 5 years ago
-        from datetime import datetime, timedelta
+        # Find prices from 1 year ago and 5 years ago. Dates are ISO
+        # 'YYYY-MM-DD' strings (the series is sorted on them), so only the
+        # latest date is parsed and the thresholds are compared as strings
         current_date = datetime.strptime(series[-1]['date'], '%Y-%m-%d')
-        one_year_ago = current_date - timedelta(days=365)
-        five_years_ago = current_date - timedelta(days=365*5)
-        
-        price_1y_ago = current_price
-        price_5y_ago = current_price
+        one_year_ago = (current_date - timedelta(days=365)).strftime('%Y-%m-%d')
+        five_years_ago = (current_date - timedelta(days=365*5)).strftime('%Y-%m-%d')
         
-        for data_point in series:
-            point_date = datetime.strptime(data_point['date'], '%Y-%m-%d')
-            if point_date >= one_year_ago and data_point['suburb'] > 0:
-                price_1y_ago = data_point['suburb']
-                break
-        
-        for data_point in series:
-            point_date = datetime.strptime(data_point['date'], '%Y-%m-%d')
-            if point_date >= five_years_ago and data_point['suburb'] > 0:
-                price_5y_ago = data_point['suburb']
-                break
+        price_1y_ago = self._first_price_since(series, one_year_ago, current_price)
+        price_5y_ago = self._first_price_since(series, five_years_ago, current_price)
         
         price_earliest = series[0]['suburb'] if series[0]['suburb'] > 0 else current_price
         
@@ -432,6 +467,24 @@ class DataAggregatorService:
             'growth_total': round(growth_total, 2)
         }
     
+    def _first_price_since(self, series: List[Dict], start_date: str, default: float) -> float:
+        """
+        Find the first positive suburb price on or after a date
+
+        Args:
+            series: Time series data sorted by date
+            start_date: ISO date ('YYYY-MM-DD')
+            default: Price returned if no point qualifies
+
+        Returns:
+            Suburb price
+        """
+        start = bisect_left(series, start_date, key=_point_date)
+        for data_point in islice(series, start, None):
+            if data_point['suburb'] > 0:
+                return data_point['suburb']
+        return default
+    
     def _calculate_regional_comparison(self, series: List[Dict]) -> Dict:
         """
         Calculate regional price comparison
@@ -482,13 +535,15 @@ class DataAggregatorService:
         if not prices or len(prices) < 2:
             return 0.0
         
-        import statistics
-        mean = statistics.mean(prices)
+        # Plain float sample stdev; statistics.stdev computes exactly with
+        # fractions, which is far slower and only feeds threshold checks here
+        count = len(prices)
+        mean = math.fsum(prices) / count
         if mean == 0:
             return 0.0
         
-        stdev = statistics.stdev(prices)
-        return stdev / mean
+        variance = math.fsum((price - mean) ** 2 for price in prices) / (count - 1)
+        return math.sqrt(variance) / mean
     
     def _detect_trend(self, recent_series: List[Dict]) -> str:
         """
@@ -542,8 +597,7 @@ class DataAggregatorService:
         volatility = self._calculate_volatility(prices)
         
         # Detect trend from last 6 data points
-        recent_data = series[-6:] if len(series) >= 6 else series
-        trend = self._detect_trend(recent_data)
+        trend = self._detect_trend(series[-6:])
         
         # Calculate investment score
         # Growth potential (40%): based on price appreciation
@@ -706,19 +760,25 @@ class DataAggregatorService:
         transformed = self._transform_market_trends_data(suburb_id, raw_data)
         return {suburb_id: transformed}
 
-    def _transform_schools_data(self, suburb_id: str, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _transform_schools_data(
+        self,
+        suburb_id: str,
+        raw_data: Dict[str, Any],
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Transform raw API schools data to frontend format
         
         Args:
             suburb_id: Suburb ID
             raw_data: Raw API data (may contain results array)
+            limit: Maximum number of schools to return (all if None)
             
         Returns:
             Transformed data in frontend format
         """
         if not raw_data:
-            return {'schools': [], 'total': 0}
+            return {'schools': [], 'total': 0, 'showing': 0}
         
         # If API format with 'results' array
         if 'results' in raw_data:
@@ -727,6 +787,8 @@ class DataAggregatorService:
             for item in results:
                 if not isinstance(item, dict):
                     continue
+                if len(schools) == limit:
+                    break
                 
                 school = {
                     'name': item.get('name', ''),
@@ -761,7 +823,8 @@ class DataAggregatorService:
             
             return {
                 'schools': schools,
-                'total': len(schools)
+                'total': len(results),
+                'showing': len(schools)
             }
         
         # Already in correct format
@@ -789,7 +852,7 @@ class DataAggregatorService:
                 return data
         
         # Transform API format to frontend format
-        transformed = self._transform_schools_data(suburb_id, raw_data)
+        transformed = self._transform_schools_data(suburb_id, raw_data, limit=MAX_SCHOOLS)
         return {suburb_id: transformed}
 
     def _transform_developments_data(self, suburb_id: str, raw_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -810,19 +873,21 @@ class DataAggregatorService:
         if 'results' in raw_data:
             results = raw_data['results']
             developments = []
-            for idx, item in enumerate(results[:50]):  # Limit to 50
+            for idx, item in enumerate(results):
                 if not isinstance(item, dict):
                     continue
+                if len(developments) == MAX_DEVELOPMENTS:
+                    break
 
                 development = {
-                    'id': item.get('id', f'dev-{idx}'),
-                    'name': item.get('description', item.get('name', 'Development Application')),
-                    'type': item.get('category', item.get('development_type', 'Residential')),
+                    'id': item['id'] if 'id' in item else f'dev-{idx}',
+                    'name': pick_alias(item, 'description', 'name', 'Development Application'),
+                    'type': pick_alias(item, 'category', 'development_type', 'Residential'),
                     'status': item.get('status', 'Unknown'),
                     'units': item.get('units', 0),
-                    'address': item.get('area_name', item.get('address', '')),
+                    'address': pick_alias(item, 'area_name', 'address', ''),
                     'applicant': item.get('applicant', 'Unknown'),
-                    'submittedDate': item.get('date', item.get('lodgement_date', item.get('submitted_date', '')))
+                    'submittedDate': pick_first(item, _DEVELOPMENT_DATE_KEYS, '')
                 }
                 developments.append(development)
             
@@ -921,29 +986,21 @@ class DataAggregatorService:
         # For now, return street insights data
         # The frontend expects an array of street data
         insights = self.get_street_insights(suburb_id, False, property_type)
-
-        if not insights or suburb_id not in insights:
-            return []
-
-        # Extract and flatten the results
-        raw_data = insights.get(suburb_id, {})
+        raw_data = insights.get(suburb_id) if insights else None
 
         # Handle nested results structure from API: { "results": [[...]] }
-        if isinstance(raw_data, dict) and 'results' in raw_data:
+        try:
             results = raw_data['results']
-            # Flatten nested arrays
-            if isinstance(results, list) and len(results) > 0:
-                if isinstance(results[0], list):
-                    # Flatten [[...]] to [...]
-                    return results[0] if len(results[0]) > 0 else []
-                return results
-            return []
+        except (KeyError, TypeError):
+            # If it's already an array, return as is
+            return raw_data if isinstance(raw_data, list) else []
 
-        # If it's already an array, return as is
-        if isinstance(raw_data, list):
-            return raw_data
+        if not isinstance(results, list) or not results:
+            return []
 
-        return []
+        # Flatten [[...]] to [...]
+        first = results[0]
+        return first if isinstance(first, list) else results
 
     def get_risk_factors(self, suburb_id: str, geojson: bool = True) -> Optional[Dict[str, Any]]:
         """
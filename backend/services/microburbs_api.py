@@ -4,29 +4,93 @@ Handles all external Microburbs API calls
 """
 import requests
 import logging
-import sys
-import os
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import config
+from utils.cache import TTLCache
+from utils.circuit_breaker import CircuitBreaker
+from utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Validators are kept one response-cache lifetime past the cached response,
+# long enough to revalidate the request that follows its expiry
+_VALIDATOR_TTL = 2 * config.CACHE_TTL
+
+# Validators hold full bodies (GeoJSON included), so keep fewer than responses
+_VALIDATOR_MAX_ENTRIES = max(1, config.CACHE_MAX_ENTRIES // 4)
+
 
 class MicroburbsApiService:
     """Service for calling Microburbs API endpoints"""
-    
+
     def __init__(self):
         self.base_url = config.MICROBURBS_API_BASE_URL
         self.headers = config.get_api_headers()
         self.timeout = config.API_TIMEOUT
+        self.session = self._create_session()
+        # Last ETag and body of recently requested URLs, so expired cache
+        # entries can be revalidated with If-None-Match
+        self._validators = TTLCache(maxsize=_VALIDATOR_MAX_ENTRIES, ttl=_VALIDATOR_TTL)
+        # Skips requests while the API is down, so callers fall back without waiting on timeouts
+        self._breaker = CircuitBreaker(config.API_BREAKER_THRESHOLD, config.API_BREAKER_COOLDOWN)
+        # Concurrent identical requests share one upstream call
+        self._inflight = SingleFlight()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create HTTP session that reuses TCP/TLS connections across calls
+
+        Returns:
+            Session with pooled adapters and default headers
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+
+        # Retry refused connections and gateway errors, but never re-send after a
+        # read timeout: that would multiply API_TIMEOUT before the file fallback
+        retry = Retry(
+            total=2,
+            connect=1,
+            read=0,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET'})
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=config.API_POOL_SIZE,
+            max_retries=retry
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections held by the session"""
+        self.session.close()
+
+    def __enter__(self) -> 'MicroburbsApiService':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Make HTTP request to Microburbs API
         
+        Responses carrying an ETag are remembered for 2 * config.CACHE_TTL
+        seconds (the most recent config.CACHE_MAX_ENTRIES / 4 of them); repeat
+        requests send If-None-Match and reuse the remembered body on 304 Not
+        Modified.
+        After config.API_BREAKER_THRESHOLD consecutive timeouts, connection
+        errors or 5xx responses, requests are skipped (returning None) for
+        config.API_BREAKER_COOLDOWN seconds. Concurrent identical requests
+        share one upstream call.
+        
         Args:
             endpoint: API endpoint path (e.g. '/suburb/info')
             params: Query parameters dictionary
@@ -34,35 +98,65 @@ class MicroburbsApiService:
         Returns:
             JSON response data, or None if request fails
         """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        return self._inflight.do(key, self._send_request, key, endpoint, params)
+
+    def _send_request(
+        self,
+        key: tuple,
+        endpoint: str,
+        params: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Perform one upstream request (see _make_request)"""
         url = f"{self.base_url}{endpoint}"
+        validator = self._validators.get(key)
+        
+        if not self._breaker.allow():
+            logger.debug(f"API circuit open, skipping request: {endpoint}")
+            return None
         
         try:
             logger.info(f"Calling Microburbs API: {url} with params: {params}")
-            response = requests.get(
+            response = self.session.get(
                 url,
                 params=params,
-                headers=self.headers,
+                headers={'If-None-Match': validator[0]} if validator else None,
                 timeout=self.timeout
             )
+            if response.status_code < 500:
+                self._breaker.record_success()
+            if validator and response.status_code == 304:
+                logger.info(f"API response not modified: {endpoint}")
+                return validator[1]
+            
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"API call successful: {endpoint}")
+            
+            etag = response.headers.get('ETag')
+            if etag:
+                self._validators.set(key, (etag, data))
             return data
         
         except requests.exceptions.Timeout:
             logger.error(f"API request timeout: {url}")
+            self._breaker.record_failure()
             return None
         
         except requests.exceptions.ConnectionError:
             logger.error(f"API connection failed: {url}")
+            self._breaker.record_failure()
             return None
         
         except requests.exceptions.HTTPError as e:
             logger.error(f"API HTTP error: {url}, status code: {e.response.status_code}")
+            if e.response.status_code >= 500:
+                self._breaker.record_failure()
             return None
         
         except requests.exceptions.RequestException as e:
             logger.error(f"API request exception: {url}, error: {str(e)}")
+            self._breaker.record_failure()
             return None
         
         except ValueError as e:
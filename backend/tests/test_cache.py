@@ -0,0 +1,66 @@
+"""
+Cache Tests
+"""
+import time
+import unittest
+
+from utils.cache import TTLCache, LFUTTLCache
+
+
+class TTLCacheTest(unittest.TestCase):
+    """Tests for TTLCache"""
+
+    def test_entries_expire(self):
+        cache = TTLCache(maxsize=3, ttl=0.05)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+
+        time.sleep(0.06)
+        self.assertIsNone(cache.get('a'))
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+
+class LFUTTLCacheTest(unittest.TestCase):
+    """Tests for LFUTTLCache"""
+
+    def test_evicts_least_frequently_used(self):
+        cache = LFUTTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        cache.set('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_expired_hot_entries_are_dropped_before_eviction(self):
+        cache = LFUTTLCache(maxsize=3, ttl=0.05)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+            for _ in range(5):
+                cache.get(key)
+
+        time.sleep(0.06)
+        cache.set('x', 'x')
+        cache.set('y', 'y')
+
+        self.assertEqual(cache.get('x'), 'x')
+        self.assertEqual(cache.get('y'), 'y')
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
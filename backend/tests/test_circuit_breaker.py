@@ -0,0 +1,89 @@
+"""
+Circuit Breaker Tests
+"""
+import threading
+import time
+import unittest
+
+from utils.circuit_breaker import CircuitBreaker
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    """Tests for CircuitBreaker"""
+
+    def _open_breaker(self, cooldown: float = 0.05) -> CircuitBreaker:
+        breaker = CircuitBreaker(threshold=2, cooldown=cooldown)
+        breaker.record_failure()
+        breaker.record_failure()
+        return breaker
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(threshold=2, cooldown=60)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+        self.assertTrue(breaker.is_open)
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(threshold=2, cooldown=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+
+    def test_half_open_admits_single_concurrent_trial(self):
+        breaker = self._open_breaker()
+        time.sleep(0.06)
+
+        callers = 16
+        barrier = threading.Barrier(callers)
+        admitted = []
+        lock = threading.Lock()
+
+        def call():
+            barrier.wait()
+            allowed = breaker.allow()
+            with lock:
+                admitted.append(allowed)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(admitted.count(True), 1)
+        self.assertEqual(len(admitted), callers)
+
+    def test_is_open_does_not_consume_trial(self):
+        breaker = self._open_breaker()
+        time.sleep(0.06)
+
+        self.assertFalse(breaker.is_open)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+
+    def test_failed_trial_reopens(self):
+        breaker = self._open_breaker()
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+        self.assertTrue(breaker.is_open)
+
+    def test_successful_trial_closes(self):
+        breaker = self._open_breaker()
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.is_open)
+
+
+if __name__ == '__main__':
+    unittest.main()
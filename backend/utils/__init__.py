@@ -2,12 +2,23 @@
 Utilities Package
 Helper utilities for logging, monitoring, etc.
 """
-from .logger import StructuredLogger, get_logger
+from .logger import StructuredLogger, get_logger, start_queue_logging
 from .performance import PerformanceMonitor, performance_monitor
+from .json_provider import OrjsonProvider, dumps_json
+from .cache import TTLCache, LFUTTLCache
+from .singleflight import SingleFlight
+from .circuit_breaker import CircuitBreaker
 
 __all__ = [
     'StructuredLogger',
     'get_logger',
+    'start_queue_logging',
     'PerformanceMonitor',
     'performance_monitor',
+    'OrjsonProvider',
+    'dumps_json',
+    'TTLCache',
+    'LFUTTLCache',
+    'SingleFlight',
+    'CircuitBreaker',
 ]
@@ -0,0 +1,205 @@
+"""
+In-Memory Cache
+Provides thread-safe TTL caches with LRU or LFU eviction
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire after a fixed time-to-live"""
+
+    __slots__ = ('maxsize', 'ttl', '_data', '_lock')
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of entries; least recently used entries are evicted first
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Cached value or default
+        """
+        entry = self.get_entry(key)
+        return default if entry is None else entry[1]
+
+    def get_entry(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        Get cached value with its expiry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (expires_at, value) with expires_at on the time.monotonic() clock,
+            or None on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value, evicting the least recently used entry if the cache is full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Lifetime in seconds for this entry (defaults to the cache's ttl)
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove entry and return its value
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is not cached
+
+        Returns:
+            Removed value or default
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+class LFUTTLCache(TTLCache):
+    """TTL cache that evicts the least frequently used entry when full
+
+    Ties are broken by recency, so among equally used entries the least
+    recently used one goes first. Eviction scans the entries, which is fine
+    for the few hundred entries this app caches.
+    """
+
+    __slots__ = ('_hits',)
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of entries; least frequently used entries are evicted first
+            ttl: Entry lifetime in seconds
+        """
+        super().__init__(maxsize, ttl)
+        self._hits: Dict[Hashable, int] = {}
+
+    def get_entry(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        Get cached value with its expiry, counting the hit
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (expires_at, value) with expires_at on the time.monotonic() clock,
+            or None on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                del self._hits[key]
+                return None
+
+            self._data.move_to_end(key)
+            self._hits[key] += 1
+            return entry
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value, evicting the least frequently used entry if the cache is full
+
+        Expired entries are dropped before any live entry is evicted, so
+        entries that were hot once cannot pin the cache after they expire.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Lifetime in seconds for this entry (defaults to the cache's ttl)
+        """
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                now = time.monotonic()
+                expired = [k for k, (expires_at, _) in self._data.items() if expires_at <= now]
+                for k in expired:
+                    del self._data[k]
+                    del self._hits[k]
+
+                if len(self._data) >= self.maxsize:
+                    coldest = min(self._data, key=self._hits.__getitem__)
+                    del self._data[coldest]
+                    del self._hits[coldest]
+
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            self._hits.setdefault(key, 0)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove entry and return its value
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is not cached
+
+        Returns:
+            Removed value or default
+        """
+        with self._lock:
+            self._hits.pop(key, None)
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+            self._hits.clear()
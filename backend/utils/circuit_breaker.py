@@ -0,0 +1,75 @@
+"""
+Circuit Breaker
+Stops calling a failing dependency for a cool-down period
+"""
+import threading
+import time
+
+
+class CircuitBreaker:
+    """Open after a run of consecutive failures and reject calls until the cool-down ends"""
+
+    __slots__ = ('threshold', 'cooldown', '_failures', '_open_until', '_lock')
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30):
+        """
+        Initialize circuit breaker
+
+        Args:
+            threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open before calls are tried again
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be attempted
+
+        After the cool-down exactly one caller is admitted as a trial call
+        and the circuit stays open for everyone else; if the trial fails the
+        circuit opens again straight away, if it succeeds the circuit closes.
+        A trial that records neither outcome is retried after another
+        cool-down.
+
+        Returns:
+            False while the circuit is open (or a trial call is under way)
+
+        Usage:
+            if breaker.allow():
+                ...
+        """
+        if not self._open_until:
+            return True
+
+        with self._lock:
+            if not self._open_until:
+                return True
+            now = time.monotonic()
+            if now < self._open_until:
+                return False
+            # Half-open: admit this caller only, keep rejecting the rest
+            self._open_until = now + self.cooldown
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count"""
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit once the threshold is reached"""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._open_until = time.monotonic() + self.cooldown
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected"""
+        open_until = self._open_until
+        return bool(open_until) and time.monotonic() < open_until
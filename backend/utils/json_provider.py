@@ -0,0 +1,104 @@
+"""
+JSON Provider
+Flask JSON provider backed by orjson for faster response serialization
+"""
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serialize types orjson does not handle the way Flask's encoder did
+
+    Args:
+        obj: Object that orjson could not serialize natively
+
+    Returns:
+        JSON-serializable representation of the object
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, date):
+        return http_date(obj)
+
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+
+    if dataclasses.is_dataclass(obj):
+        # DTOs define their own camelCase wire format
+        to_dict = getattr(obj, 'to_dict', None)
+        return to_dict() if to_dict is not None else dataclasses.asdict(obj)
+
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes
+
+    Args:
+        obj: Data to serialize
+        sort_keys: Whether to sort dictionary keys
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        JSON bytes ready to be used as a response body
+    """
+    option = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON
+
+        Args:
+            obj: Data to serialize
+            **kwargs: Formatting options passed by Flask (only indent and sort_keys are honoured)
+
+        Returns:
+            JSON string
+        """
+        return dumps_json(
+            obj,
+            sort_keys=kwargs.get('sort_keys', self.sort_keys),
+            indent=bool(kwargs.get('indent'))
+        ).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize data as JSON
+
+        Args:
+            s: Text or UTF-8 bytes
+            **kwargs: Ignored, kept for interface compatibility
+
+        Returns:
+            Parsed Python object
+        """
+        return orjson.loads(s)
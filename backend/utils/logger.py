@@ -2,16 +2,26 @@
 Structured Logger
 Provides JSON-formatted structured logging with context
 """
+import atexit
 import logging
-import json
+import queue
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+import orjson
+from typing import Dict, Any, Mapping, Optional
 from flask import has_request_context, request, g
 
+# Context used outside of requests (shared, read-only)
+_NO_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
 
 class StructuredLogger:
     """Logger with structured JSON output"""
 
+    __slots__ = ('logger',)
+
     def __init__(self, name: str):
         """
         Initialize structured logger
@@ -21,24 +31,35 @@ class StructuredLogger:
         """
         self.logger = logging.getLogger(name)
 
-    def _get_context(self) -> Dict[str, Any]:
-        """Get current request context"""
+    def _get_context(self) -> Mapping[str, Any]:
+        """Get current request context (built once per request, then reused)"""
+        if not has_request_context():
+            return _NO_CONTEXT
+
+        context = g.get('_log_context')
+        if context is not None:
+            return context
+
         context = {}
 
-        if has_request_context():
-            # Add request ID if available
-            if hasattr(g, 'request_id'):
-                context['request_id'] = g.request_id
+        # Add request ID if available
+        if 'request_id' in g:
+            context['request_id'] = g.request_id
 
-            # Add request info
-            context['method'] = request.method
-            context['path'] = request.path
-            context['remote_addr'] = request.remote_addr
+        # Add request info
+        req = request._get_current_object()
+        context['method'] = req.method
+        context['path'] = req.path
+        context['remote_addr'] = req.remote_addr
 
-            # Add user agent if available
-            if request.headers.get('User-Agent'):
-                context['user_agent'] = request.headers.get('User-Agent')
+        # Add user agent if available
+        user_agent = req.headers.get('User-Agent')
+        if user_agent:
+            context['user_agent'] = user_agent
 
+        # Only cache once the request ID is known, so it is never left out
+        if 'request_id' in context:
+            g._log_context = context
         return context
 
     def _format_message(
@@ -59,7 +80,7 @@ class StructuredLogger:
             JSON formatted log string
         """
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'level': level,
             'message': message,
             **self._get_context()
@@ -68,33 +89,36 @@ class StructuredLogger:
         if extra:
             log_data['extra'] = extra
 
-        return json.dumps(log_data)
+        # orjson renders the datetime in ISO format itself
+        return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def _log(self, level: int, level_name: str, message: str, extra: Dict[str, Any]):
+        """Format and emit a message, skipping all work if the level is disabled"""
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, self._format_message(level_name, message, extra), stacklevel=3)
 
     def debug(self, message: str, **kwargs):
         """Log debug message"""
-        self.logger.debug(self._format_message('DEBUG', message, kwargs))
+        self._log(logging.DEBUG, 'DEBUG', message, kwargs)
 
     def info(self, message: str, **kwargs):
         """Log info message"""
-        self.logger.info(self._format_message('INFO', message, kwargs))
+        self._log(logging.INFO, 'INFO', message, kwargs)
 
     def warning(self, message: str, **kwargs):
         """Log warning message"""
-        self.logger.warning(self._format_message('WARNING', message, kwargs))
+        self._log(logging.WARNING, 'WARNING', message, kwargs)
 
     def error(self, message: str, **kwargs):
         """Log error message"""
-        self.logger.error(self._format_message('ERROR', message, kwargs))
+        self._log(logging.ERROR, 'ERROR', message, kwargs)
 
     def critical(self, message: str, **kwargs):
         """Log critical message"""
-        self.logger.critical(self._format_message('CRITICAL', message, kwargs))
-
-
-# Cache for logger instances
-_loggers: Dict[str, StructuredLogger] = {}
+        self._log(logging.CRITICAL, 'CRITICAL', message, kwargs)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> StructuredLogger:
     """
     Get or create a structured logger instance
@@ -109,6 +133,36 @@ def get_logger(name: str) -> StructuredLogger:
         logger = get_logger(__name__)
         logger.info('Processing request', user_id=123)
     """
-    if name not in _loggers:
-        _loggers[name] = StructuredLogger(name)
-    return _loggers[name]
+    return StructuredLogger(name)
+
+
+def start_queue_logging() -> Optional[QueueListener]:
+    """
+    Move the root logger's handlers onto a background thread
+
+    Log calls then only enqueue the record; formatting by the handlers and
+    the stream/file writes happen on the listener thread. Call once per
+    process after logging is configured. The listener is stopped (and the
+    queue flushed) at interpreter exit.
+
+    Returns:
+        Running QueueListener, or None if the root logger has no handlers
+
+    Usage:
+        logging.basicConfig(level=logging.INFO)
+        start_queue_logging()
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if not handlers:
+        return None
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -4,12 +4,16 @@ Tracks and logs request performance metrics
 """
 import time
 import logging
+from contextvars import ContextVar
 from functools import wraps
 from typing import Callable
 from flask import g, has_request_context
 
 logger = logging.getLogger(__name__)
 
+# Start of the current timing (perf_counter_ns), 0 when no timer is running
+_perf_start_ns: ContextVar[int] = ContextVar('perf_start_ns', default=0)
+
 
 class PerformanceMonitor:
     """Monitor and log performance metrics"""
@@ -17,8 +21,7 @@ class PerformanceMonitor:
     @staticmethod
     def start_timer():
         """Start performance timer for current request"""
-        if has_request_context():
-            g.start_time = time.time()
+        _perf_start_ns.set(time.perf_counter_ns())
 
     @staticmethod
     def end_timer(endpoint_name: str = None):
@@ -28,36 +31,45 @@ class PerformanceMonitor:
         Args:
             endpoint_name: Name of the endpoint being monitored
         """
-        if has_request_context() and hasattr(g, 'start_time'):
-            duration = time.time() - g.start_time
-            duration_ms = round(duration * 1000, 2)
-
-            # Log performance
-            logger.info(
-                f"Request completed - "
-                f"endpoint: {endpoint_name or 'unknown'}, "
-                f"duration: {duration_ms}ms, "
-                f"request_id: {getattr(g, 'request_id', 'N/A')}"
-            )
-
-            # Store for response headers
+        start_ns = _perf_start_ns.get()
+        if not start_ns:
+            return
+
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        _perf_start_ns.set(0)
+        in_request = has_request_context()
+
+        # Log performance
+        logger.info(
+            "Request completed - endpoint: %s, duration: %.2fms, request_id: %s",
+            endpoint_name or 'unknown',
+            duration_ms,
+            g.get('request_id', 'N/A') if in_request else 'N/A'
+        )
+
+        # Store for response headers
+        if in_request:
             g.request_duration_ms = duration_ms
 
     @staticmethod
     def get_duration() -> float:
         """Get current request duration in milliseconds"""
-        if has_request_context() and hasattr(g, 'start_time'):
-            duration = time.time() - g.start_time
-            return round(duration * 1000, 2)
+        start_ns = _perf_start_ns.get()
+        if start_ns:
+            return (time.perf_counter_ns() - start_ns) / 1e6
         return 0.0
 
 
-def performance_monitor(endpoint_name: str = None) -> Callable:
+def performance_monitor(endpoint_name: str = None, threshold_ms: float = 1.0) -> Callable:
     """
     Decorator to monitor function performance
 
+    Calls are only timed while debug logging is enabled, and only calls
+    taking at least threshold_ms are logged.
+
     Args:
         endpoint_name: Name of the endpoint for logging
+        threshold_ms: Minimum duration (milliseconds) worth logging
 
     Returns:
         Decorated function with performance monitoring
@@ -71,19 +83,20 @@ def performance_monitor(endpoint_name: str = None) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+
             name = endpoint_name or func.__name__
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
-                duration_ms = round(duration * 1000, 2)
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
-                logger.debug(
-                    f"Function '{name}' executed in {duration_ms}ms"
-                )
+                if duration_ms >= threshold_ms:
+                    logger.debug("Function '%s' executed in %.2fms", name, duration_ms)
 
         return wrapper
     return decorator
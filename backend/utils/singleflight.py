@@ -0,0 +1,56 @@
+"""
+Single-Flight Call Coalescing
+Lets concurrent callers asking for the same key share one in-flight call
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent duplicates wait for its result"""
+
+    __slots__ = ('_calls', '_lock')
+
+    def __init__(self):
+        """Initialize in-flight call registry"""
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Call fn, or wait for the identical call already in progress
+
+        Args:
+            key: Identity of the call; callers with equal keys share one result
+            fn: Function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of fn (shared between coalesced callers, do not mutate)
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]